@@ -12,13 +12,39 @@ Example usage:
     $ tiss-tuwel-cli timeline
 """
 
-from .clients.tiss import TissClient
-from .clients.tuwel import TuwelClient, TuwelAPIError
-from .config import ConfigManager
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
+if TYPE_CHECKING:
+    from .clients.tiss import TissClient
+    from .clients.tuwel import TuwelClient, TuwelAPIError
+    from .config import ConfigManager
+
+__all__ = (
     "TissClient",
     "TuwelClient",
     "TuwelAPIError",
     "ConfigManager",
-]
+)
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package - which every CLI invocation does - doesn't pull in requests & co.
+_LAZY_ATTRS = {
+    "TissClient": ".clients.tiss",
+    "TuwelClient": ".clients.tuwel",
+    "TuwelAPIError": ".clients.tuwel",
+    "ConfigManager": ".config",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
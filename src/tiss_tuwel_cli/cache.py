@@ -0,0 +1,95 @@
+"""
+Persistent response cache for the TU Wien Companion CLI.
+
+Decoded API responses are stored as small JSON files, so that back-to-back
+CLI invocations (e.g. `dashboard` followed by `weekly`) can reuse them
+instead of going over the network again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Root directory of all cached responses, one subdirectory per namespace
+CACHE_DIR = Path.home() / ".tu_companion" / "cache"
+
+
+def _entry_path(namespace: str, key: str) -> Path:
+    """Return the file path of a cache entry."""
+    return CACHE_DIR / namespace / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def load(namespace: str, key: str, ttl: float) -> Optional[Any]:
+    """
+    Return a cached value if it was stored less than ``ttl`` seconds ago.
+
+    Args:
+        namespace: Cache namespace (e.g. "tuwel").
+        key: Key identifying the cached value.
+        ttl: Maximum age of the entry in seconds.
+
+    Returns:
+        The cached value, or None if it is missing, expired or unreadable.
+    """
+    path = _entry_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        with open(path, 'rb') as f:
+            content = f.read()
+        return orjson.loads(content) if orjson else json.loads(content)
+    except (OSError, ValueError):
+        return None
+
+
+def store(namespace: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serializable value.
+
+    The entry is written to a private temporary file and atomically moved
+    into place, so concurrent readers never see a partial entry. Failures
+    are ignored - the cache is only an optimization.
+
+    Args:
+        namespace: Cache namespace (e.g. "tuwel").
+        key: Key identifying the value.
+        value: The value to store.
+    """
+    path = _entry_path(namespace, key)
+    try:
+        data = orjson.dumps(value) if orjson else json.dumps(value).encode()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0o600, responses can be personal
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def clear(namespace: str) -> None:
+    """
+    Remove all entries of a namespace.
+
+    Args:
+        namespace: Cache namespace to clear.
+    """
+    for path in (CACHE_DIR / namespace).glob('*.json'):
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -5,10 +5,15 @@ This package contains the Typer-based CLI application and its commands
 for interacting with TISS and TUWEL services.
 """
 
+import threading
+import time
+from typing import Optional, Tuple
+
 import typer
 from rich import print as rprint
 from rich.console import Console
 
+from tiss_tuwel_cli import cache
 from tiss_tuwel_cli.clients.tiss import TissClient
 from tiss_tuwel_cli.clients.tuwel import TuwelClient
 from tiss_tuwel_cli.config import ConfigManager
@@ -26,6 +31,21 @@ config = ConfigManager()
 tiss = TissClient()
 
 
+# How long a successful token validation is trusted before re-checking (seconds)
+VALIDATION_TTL = 900
+
+# A refreshed token is handed to concurrent callers for this long (seconds),
+# so racing requests share a single browser login.
+REFRESH_TTL = 30
+
+_refresh_lock = threading.Lock()
+_refresh_cache: Optional[Tuple[str, float]] = None
+
+# Client handed out by get_tuwel_client, reused while the token is unchanged
+# so repeated commands in one process (e.g. the shell) share its session.
+_tuwel_client: Optional[TuwelClient] = None
+
+
 @app.callback()
 def main(
         ctx: typer.Context,
@@ -53,6 +73,77 @@ def main(
         raise typer.Exit()
 
 
+def _tuwel_cache_namespace(user_id: Optional[int]) -> Optional[str]:
+    """Return the disk cache namespace of a TUWEL user (None without a user ID)."""
+    return f"tuwel-{user_id}" if user_id else None
+
+
+def clear_tuwel_cache() -> None:
+    """
+    Drop the cached TUWEL responses of the current user, in memory and on disk.
+
+    Called when the token or credentials are cleared, so no personal data
+    outlives the login it was fetched with.
+    """
+    global _tuwel_client
+    if _tuwel_client is not None:
+        _tuwel_client.clear_cache()
+        _tuwel_client = None
+    namespace = _tuwel_cache_namespace(config.get_user_id())
+    if namespace:
+        cache.clear(namespace)
+
+
+def _recent_refresh() -> Optional[str]:
+    """Return the token from a refresh within the last ``REFRESH_TTL`` seconds."""
+    cached = _refresh_cache
+    if cached and time.time() - cached[1] < REFRESH_TTL:
+        return cached[0]
+    return None
+
+
+def _refresh_token() -> str:
+    """
+    Refresh the TUWEL token via automatic login (the client's refresh callback).
+
+    Concurrent callers are serialized so that only one of them runs the
+    browser login; the others receive the token it produced.
+    """
+    global _refresh_cache
+
+    token = _recent_refresh()
+    if token:
+        return token
+
+    with _refresh_lock:
+        token = _recent_refresh()
+        if token:
+            return token
+        token = _login_for_new_token()
+        _refresh_cache = (token, time.time())
+        return token
+
+
+def _login_for_new_token() -> str:
+    """Run the automatic login and return the newly stored token."""
+    # Only attempt if auto-login is enabled (default is True)
+    if not config.get_setting("auto_login", True):
+        # If auto-login is disabled, we can't do anything automatically
+        raise Exception("Auto-login is disabled.")
+
+    user, passw = config.get_login_credentials()
+    if user:
+        rprint("[yellow]Token invalid. Auto-login triggered...[/yellow]")
+        from tiss_tuwel_cli.cli.auth import _run_playwright_login_internal
+        # Attempt silent login
+        success = _run_playwright_login_internal(user, passw, False)
+        if success:
+            new_token = config.get_tuwel_token()
+            if new_token:
+                return new_token
+    raise Exception("Auto-login failed.")
+
+
 def get_tuwel_client(force_new_token: bool = False) -> TuwelClient:
     """
     Get an authenticated TUWEL client, automatically handling token validation and refresh.
@@ -84,37 +175,34 @@ def get_tuwel_client(force_new_token: bool = False) -> TuwelClient:
             rprint("[bold red]Error:[/bold red] TUWEL token not found. Please run [green]tiss-tuwel-cli login[/green] first.")
             raise typer.Exit()
 
-    def refresh_callback() -> str:
-        """Callback to refresh the token if invalid."""
-        # Only attempt if auto-login is enabled (default is True)
-        if not config.get_setting("auto_login", True):
-            # If auto-login is disabled, we can't do anything automatically
-            raise Exception("Auto-login is disabled.")
-
-        user, _ = config.get_login_credentials()
-        if user:
-            rprint("[yellow]Token invalid. Auto-login triggered...[/yellow]")
-            from tiss_tuwel_cli.cli.auth import _run_playwright_login_internal
-            # Attempt silent login
-            success = _run_playwright_login_internal(user, _, False)
-            if success:
-                new_token = config.get_tuwel_token()
-                if new_token:
-                    return new_token
-        raise Exception("Auto-login failed.")
+    # Reuse the previous client (and its connection pool) if the token matches,
+    # otherwise initialize one with the refresh callback
+    global _tuwel_client
+    client = _tuwel_client
+    if client is None or client.token != token:
+        user_id = config.get_user_id()
+        client = _tuwel_client = TuwelClient(
+            token,
+            token_refresh_callback=_refresh_token,
+            cache_namespace=_tuwel_cache_namespace(user_id),
+        )
+
+    # 2. Validate existing token (skipped if it was validated recently; an
+    # expired token is still recovered through the refresh callback)
+    validated_at = config.get_token_validation(token)
+    if validated_at is not None and time.time() - validated_at < VALIDATION_TTL:
+        return client
 
-    # Initialize client with the refresh callback
-    client = TuwelClient(token, token_refresh_callback=refresh_callback)
-
-    # 2. Validate existing token
     try:
-        client.get_site_info()
+        info = client.get_site_info()
+        config.set_token_validation(token, info.get('userid'), time.time())
     except Exception:
         # If validation fails immediately, try the manual refresh flow once
         # (This handles the startup case where token is known bad)
         try:
-            new_token = refresh_callback()
-            return TuwelClient(new_token, token_refresh_callback=refresh_callback)
+            # Swap the token on the existing client (and its session) in place
+            client.token = _refresh_token()
+            return client
         except Exception:
             # If that fails, notify user
             pass
@@ -132,30 +220,33 @@ def get_tuwel_client(force_new_token: bool = False) -> TuwelClient:
 
 
 # Import and register command modules
-from tiss_tuwel_cli.cli import auth, courses, dashboard, features, timeline, todo, settings, rc
-
-# Register commands
-app.command()(auth.login)
-app.command()(dashboard.dashboard)
-app.command()(courses.courses)
-app.command()(courses.assignments)
-app.command()(courses.grades)
-app.command()(courses.checkmarks)
-app.command()(courses.download)
-app.command()(courses.tiss_course)
-app.command(name="track-participation")(courses.track_participation)
-app.command(name="participation-stats")(courses.participation_stats)
-app.command(name="open-vowi")(courses.open_vowi)
-
-# Register new feature commands
-app.command(name="export-calendar")(features.export_calendar)
-app.command(name="course-stats")(features.course_statistics)
-app.command(name="unified-view")(features.unified_course_view)
-
-# Other commands
-app.command()(timeline.timeline)
-app.command()(todo.todo)
-app.command()(settings.settings)
-app.command()(rc.rc)
+from tiss_tuwel_cli.cli import auth, courses, dashboard, features, rc, settings, timeline, todo
+
+# Command table: (name, function); a name of None lets Typer derive it
+_COMMANDS = (
+    (None, auth.login),
+    (None, dashboard.dashboard),
+    (None, courses.courses),
+    (None, courses.assignments),
+    (None, courses.grades),
+    (None, courses.checkmarks),
+    (None, courses.download),
+    (None, courses.tiss_course),
+    ("track-participation", courses.track_participation),
+    ("participation-stats", courses.participation_stats),
+    ("open-vowi", courses.open_vowi),
+    # Feature commands
+    ("export-calendar", features.export_calendar),
+    ("course-stats", features.course_statistics),
+    ("unified-view", features.unified_course_view),
+    # Other commands
+    (None, timeline.timeline),
+    (None, todo.todo),
+    (None, settings.settings),
+    (None, rc.rc),
+)
+
+for _name, _command in _COMMANDS:
+    app.command(name=_name)(_command)
 
 __all__ = ["app", "console", "config", "tiss", "get_tuwel_client"]
@@ -5,10 +5,12 @@ This module provides commands for logging in and configuring
 TUWEL authentication tokens.
 """
 
+import json
+import re
 import time
+from typing import Any, Dict, Optional
 
 import typer
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
@@ -22,6 +24,71 @@ from tiss_tuwel_cli.utils import parse_mobile_token
 console = Console()
 config = ConfigManager()
 
+# Saved browser session (cookies, local storage), resolved once
+_STORAGE_STATE_PATH = config.get_storage_state_path()
+
+# Page that redirects a logged-in browser to the moodlemobile:// token URL
+_LAUNCH_URL = "https://tuwel.tuwien.ac.at/admin/tool/mobile/launch.php?service=moodle_mobile_app&passport=student_api"
+
+# Page that answers 200 for a logged-in TUWEL session and redirects to the
+# login page otherwise; used to probe a saved session without waiting
+_SESSION_PROBE_URL = "https://tuwel.tuwien.ac.at/my/"
+
+# Prefix of the redirect URL that carries the mobile token
+_MOBILE_MARK = "moodlemobile://token="
+
+# Markers of a token URL / encoded token (as opposed to a raw token), found in one scan
+_ENCODED_TOKEN_RE = re.compile(r":::|token=")
+
+
+# Subresources the automated login never needs. Stylesheets are kept since
+# element visibility (and thus clicking) depends on them.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+def _block_assets(route) -> None:
+    """Route handler that aborts asset downloads and lets everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _require_playwright() -> None:
+    """
+    Make sure Playwright can be imported before starting a browser login.
+
+    Raises:
+        typer.Exit: With an installation hint if Playwright is missing.
+    """
+    try:
+        import playwright.sync_api  # noqa: F401
+    except ImportError:
+        rprint("[bold red]Error:[/bold red] Playwright is not installed. "
+               "Run [green]pip install playwright[/green] and [green]playwright install chromium[/green], "
+               "or use [green]tiss-tuwel-cli login --manual[/green].")
+        raise typer.Exit(1)
+
+
+def _is_token_request(request) -> bool:
+    """Return True if the browser request is the ``moodlemobile://`` token redirect."""
+    # The token URL *starts* with the marker; a prefix test rejects ordinary
+    # https:// requests after a few characters instead of scanning the URL
+    return request.url.startswith(_MOBILE_MARK)
+
+# Extra Chromium switches for the one-shot token capture. Playwright already
+# disables background networking, component updates, extensions, breakpad
+# etc. by default; these cover the remaining services it leaves on.
+_CHROMIUM_ARGS = [
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    "--no-pings",
+]
+
+# How long to wait for the token when reusing a saved session (seconds); a
+# valid session redirects almost immediately, an expired one never does.
+SESSION_WAIT_SECONDS = 5
 
 def login(
         manual: bool = typer.Option(False, "--manual", help="Start manual login by pasting a token URL instead of automating."),
@@ -43,19 +110,24 @@ def login(
         hybrid_login()
         return
 
+    _require_playwright()
     rprint("[yellow]Attempting automated TUWEL login...[/yellow]")
 
     user, passw = config.get_login_credentials()
 
-    if not all([user, passw]):
+    if not (user and passw):
         rprint("[cyan]No stored credentials found.[/cyan]")
         rprint("You can store your TUWEL credentials to enable fully automated logins.")
 
         save_creds = Prompt.ask("Store credentials for future logins?", choices=["y", "n"], default="y") == "y"
 
         if save_creds:
-            rprint("[bold yellow]Warning:[/bold yellow] Credentials will be stored in plain text in your home directory.")
-            rprint(f"Location: {config.config_file}")
+            in_keyring = config.uses_keyring
+            if in_keyring:
+                rprint("Your password will be stored in the system keyring.")
+            else:
+                rprint("[bold yellow]Warning:[/bold yellow] Credentials will be stored in plain text in your home directory.")
+                rprint(f"Location: {config.config_file}")
             proceed = Prompt.ask("Continue?", choices=["y", "n"], default="y") == "y"
             if not proceed:
                 rprint("[red]Aborted.[/red]")
@@ -63,19 +135,27 @@ def login(
 
             user = Prompt.ask("Enter TUWEL Username")
             passw = Prompt.ask("Enter TUWEL Password", password=True)
-            config.set_login_credentials(user, passw)
-            rprint("[green]Credentials saved.[/green]")
+            if config.set_login_credentials(user, passw) or not in_keyring:
+                rprint("[green]Credentials saved.[/green]")
+            else:
+                rprint("[bold yellow]Warning:[/bold yellow] The system keyring could not be used, the password was stored in plain text.")
+                rprint(f"Location: {config.config_file}")
         else:
             user = Prompt.ask("Enter TUWEL Username")
             passw = Prompt.ask("Enter TUWEL Password", password=True)
 
-    with Progress() as progress:
+    # Nothing changes on screen until the login finishes - repaint sparingly
+    with Progress(refresh_per_second=4) as progress:
         task = progress.add_task("[cyan]Logging in...", total=1)
         success = _run_playwright_login_internal(user, passw, debug)
         progress.update(task, advance=1)
 
     if success:
         rprint("[bold green]Token captured successfully![/bold green]")
+        if config.get_token_validation(config.get_tuwel_token()) is not None:
+            # Already validated from inside the browser session
+            rprint(f"Authenticated (ID: {config.get_user_id()}).")
+            return
         try:
             client = TuwelClient(config.get_tuwel_token())
             info = client.get_site_info()
@@ -87,105 +167,253 @@ def login(
         rprint("[bold red]Failed to capture token.[/bold red]")
 
 
-def _run_playwright_login_internal(user: str, passw: str, debug: bool) -> bool:
+def _load_storage_state() -> Optional[Dict[str, Any]]:
     """
-    Internal helper to run Playwright login. Returns True on success, False on failure.
-    This function is designed to be called internally and should not handle UI feedback.
+    Read the saved browser session state.
+
+    The parsed state is passed to ``new_context`` directly and later compared
+    against the new state, so the file is read (and stat'ed) once per login.
+
+    Returns:
+        The storage state dictionary, or None if there is no usable file.
     """
     try:
-        with sync_playwright() as p:
-            storage_state_path = config.config_dir / "browser_state.json"
+        with open(_STORAGE_STATE_PATH, 'rb') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
 
-            if debug:
-                rprint("[bold magenta]DEBUG MODE ENABLED[/bold magenta]")
 
-            browser = p.chromium.launch(headless=not debug)
-            context = browser.new_context(storage_state=storage_state_path if storage_state_path.exists() else None)
-            page = context.new_page()
+def _has_session_cookie(state: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a browser state holds a live TUWEL session cookie.
 
-            if debug:
-                # Log all requests and responses
-                page.on("request", lambda request: rprint(f"[magenta]>> Request: {request.method} {request.url}[/magenta]"))
-                page.on("response", lambda response: rprint(f"[magenta]<< Response: {response.status} {response.url}[/magenta]"))
+    Args:
+        state: Storage state as returned by _load_storage_state().
 
-            # 1. Go to login page
-            page.goto("https://tuwel.tuwien.ac.at/login/index.php")
-            if debug:
-                rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
+    Returns:
+        True if a MoodleSession cookie for TU Wien is present and not expired.
+    """
+    if not state:
+        return False
 
-            # If already logged in, we might be on the dashboard or a confirmation page
-            is_logged_in = "dashboard" in page.url or "bereits als" in page.content()
-            if is_logged_in:
-                if debug:
-                    rprint("[magenta]Dashboard URL or existing session detected, assuming already logged in.[/magenta]")
-            else:
-                # 2. Click TU Wien Login button
-                page.wait_for_selector('a:has-text("TU Wien Login")').click()
-                if debug:
-                    page.wait_for_load_state('networkidle')
-                    rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
+    now = time.time()
+    for cookie in state.get("cookies", []):
+        if (cookie.get("name", "").startswith("MoodleSession")
+                and cookie.get("domain", "").endswith("tuwien.ac.at")):
+            # -1 marks a session cookie, which Playwright persists as well
+            expires = cookie.get("expires", -1)
+            if expires == -1 or expires > now:
+                return True
+    return False
 
-                # 3. Fill and submit credentials
-                page.fill('input[name="username"]', user)
-                page.fill('input[name="password"]', passw)
-                page.click('button:has-text("Log in")')
-                if debug:
-                    page.wait_for_load_state('networkidle')
-                    rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
 
-            # 4. Wait for the token page and capture the URL
-            token_url = ""
+def _session_is_live(context) -> bool:
+    """
+    Check with one request whether the context's TUWEL session is still valid.
+
+    A session cookie can look live locally (session cookies never expire)
+    while Moodle has already ended the session on the server side.
+
+    Args:
+        context: The Playwright browser context holding the saved cookies.
+
+    Returns:
+        True if TUWEL serves the dashboard without redirecting to the login.
+    """
+    try:
+        response = context.request.get(_SESSION_PROBE_URL, max_redirects=0)
+    except Exception:
+        return False
+    return response.status == 200
+
+
+def _save_storage_state(context, previous: Optional[Dict[str, Any]]) -> bool:
+    """
+    Save the browser session state, skipping the write if nothing changed.
+
+    Only the TU Wien cookies (TUWEL and SSO session) are kept; local storage
+    and third-party cookies play no part in logging in and would just
+    bloat the file that every login reads back.
+
+    Args:
+        context: The Playwright browser context to save.
+        previous: The state the context was created from (as loaded from disk).
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    state = {
+        "cookies": [c for c in context.cookies() if c.get("domain", "").endswith("tuwien.ac.at")],
+        "origins": [],
+    }
+    if state == previous:
+        return False
+    _STORAGE_STATE_PATH.write_bytes(json.dumps(state, separators=(",", ":")).encode())
+    return True
 
-            def on_request(request):
-                nonlocal token_url
-                if "moodlemobile://token=" in request.url:
-                    token_url = request.url
-                    if debug:
-                        rprint(f"[bold green]>>> TOKEN URL CAPTURED: {request.url}[/bold green]")
 
-            page.on("request", on_request)
+def _fetch_site_info(context, token: str) -> Optional[Dict[str, Any]]:
+    """
+    Call core_webservice_get_site_info through the browser context.
+
+    Args:
+        context: The Playwright browser context used for the login.
+        token: The freshly captured TUWEL token.
+
+    Returns:
+        The site info dictionary, or None if the token could not be validated.
+    """
+    try:
+        response = context.request.post(TuwelClient.BASE_URL, form={
+            "wstoken": token,
+            "moodlewsrestformat": "json",
+            "wsfunction": "core_webservice_get_site_info",
+        })
+        info = response.json()
+    except Exception:
+        return None
+    if not isinstance(info, dict) or "exception" in info:
+        return None
+    return info
+
+
+def _capture_token(page, wait_seconds: float, debug: bool) -> str:
+    """
+    Open the mobile launch page and capture the ``moodlemobile://`` redirect.
 
+    The expectation is armed before navigating, so a redirect that fires
+    during goto() is not missed.
+
+    Args:
+        page: The Playwright page to navigate.
+        wait_seconds: How long to wait for the redirect.
+        debug: Whether to print debug output.
+
+    Returns:
+        The captured token URL, or an empty string on timeout.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    if debug:
+        rprint(f"[magenta]Waiting for token capture for up to {wait_seconds}s...[/magenta]")
+
+    try:
+        with page.expect_request(_is_token_request, timeout=wait_seconds * 1000) as request_info:
+            # Return as soon as the navigation commits; the redirect is awaited
+            # by the expectation, not by the page load
             try:
-                page.goto("https://tuwel.tuwien.ac.at/admin/tool/mobile/launch.php?service=moodle_mobile_app&passport=student_api")
+                page.goto(_LAUNCH_URL, wait_until="commit")
             except PlaywrightTimeoutError:
                 # This is expected if the page redirects to the custom protocol
                 if debug:
                     rprint("[magenta]Page.goto timed out as expected due to moodlemobile:// redirect.[/magenta]")
-                pass
             except Exception as e:
                 # Also ignore the ERR_ABORTED error which can happen
                 if "net::ERR_ABORTED" not in str(e):
                     raise e
                 if debug:
                     rprint(f"[magenta]Ignoring expected error: {e}[/magenta]")
+    except PlaywrightTimeoutError:
+        return ""
 
-            # Wait for the on_request handler to capture the token, polling instead of static wait
-            wait_seconds = 30 if debug else 10
-            if debug:
-                rprint(f"[magenta]Waiting for token capture for up to {wait_seconds}s...[/magenta]")
+    token_url = request_info.value.url
+    if debug:
+        rprint(f"[bold green]>>> TOKEN URL CAPTURED: {token_url}[/bold green]")
+    return token_url
 
-            end_time = time.time() + wait_seconds
-            while time.time() < end_time:
-                if token_url:
-                    if debug:
-                        rprint("[magenta]Token found, proceeding immediately.[/magenta]")
-                    break
-                page.wait_for_timeout(100)  # poll every 100ms
-
-            if debug and not token_url:
-                rprint("[bold red]DEBUG: Timed out waiting for token.[/bold red]")
-                rprint("[bold red]Dumping page content:[/bold red]")
-                try:
-                    rprint(page.content())
-                except Exception as e:
-                    rprint(f"[bold red]Could not get page content: {e}[/bold red]")
-
-            # Save the session state for the next run
-            context.storage_state(path=storage_state_path)
-            if debug:
-                rprint(f"[magenta]Browser state saved to {storage_state_path}[/magenta]")
 
-            browser.close()
+def _run_playwright_login_internal(user: str, passw: str, debug: bool) -> bool:
+    """
+    Internal helper to run Playwright login. Returns True on success, False on failure.
+    This function is designed to be called internally and should not handle UI feedback.
+    """
+    # Playwright is slow to import and only needed here, not on every CLI start
+    _require_playwright()
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
+    try:
+        if debug:
+            rprint("[bold magenta]DEBUG MODE ENABLED[/bold magenta]")
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=not debug, args=_CHROMIUM_ARGS)
+            storage_state = _load_storage_state()
+            context = browser.new_context(storage_state=storage_state)
+            try:
+                if not debug:
+                    # Nobody looks at the headless pages - skip images, fonts and media
+                    context.route("**/*", _block_assets)
+                page = context.new_page()
+
+                if debug:
+                    # Log all requests and responses
+                    page.on("request", lambda request: rprint(f"[magenta]>> Request: {request.method} {request.url}[/magenta]"))
+                    page.on("response", lambda response: rprint(f"[magenta]<< Response: {response.status} {response.url}[/magenta]"))
+
+                token_url = ""
+                if _has_session_cookie(storage_state):
+                    # A saved TUWEL session hands out the token straight away,
+                    # without visiting the login page first. Probe it first, so
+                    # a session the server already ended doesn't cost the wait.
+                    if _session_is_live(context):
+                        if debug:
+                            rprint("[magenta]Saved session is live, trying the token page directly.[/magenta]")
+                        token_url = _capture_token(page, SESSION_WAIT_SECONDS, debug)
+                    elif debug:
+                        rprint("[magenta]Saved session has expired on the server, logging in.[/magenta]")
+
+                if not token_url:
+                    # 1. Go to login page
+                    page.goto("https://tuwel.tuwien.ac.at/login/index.php", wait_until="domcontentloaded", timeout=15000)
+                    if debug:
+                        rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
+
+                    # If already logged in, we might be on the dashboard or a confirmation page.
+                    # The text probe runs inside the browser and only returns a count,
+                    # instead of serializing the whole DOM over the wire.
+                    is_logged_in = "dashboard" in page.url or page.locator("text=bereits als").count() > 0
+                    if is_logged_in:
+                        if debug:
+                            rprint("[magenta]Dashboard URL or existing session detected, assuming already logged in.[/magenta]")
+                    else:
+                        # 2. Click TU Wien Login button
+                        page.wait_for_selector('a:has-text("TU Wien Login")').click()
+                        if debug:
+                            page.wait_for_load_state('networkidle')
+                            rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
+
+                        # 3. Fill and submit credentials
+                        page.fill('input[name="username"]', user)
+                        page.fill('input[name="password"]', passw)
+                        page.click('button:has-text("Log in")')
+                        if debug:
+                            page.wait_for_load_state('networkidle')
+                            rprint(f"[magenta]On page: {page.title()} ({page.url})[/magenta]")
+
+                    # 4. Open the token page and capture the redirect URL
+                    token_url = _capture_token(page, 30 if debug else 10, debug)
+
+                found_token = parse_mobile_token(token_url) if token_url else None
+                # Validate through the browser's request context, reusing its open
+                # connection to TUWEL instead of a fresh TLS handshake later on
+                site_info = _fetch_site_info(context, found_token) if found_token else None
+
+                if debug and not token_url:
+                    rprint("[bold red]DEBUG: Timed out waiting for token.[/bold red]")
+                    rprint("[bold red]Dumping page content:[/bold red]")
+                    try:
+                        rprint(page.content())
+                    except Exception as e:
+                        rprint(f"[bold red]Could not get page content: {e}[/bold red]")
+
+                # Save the session state for the next run
+                if _save_storage_state(context, storage_state) and debug:
+                    rprint(f"[magenta]Browser state saved to {_STORAGE_STATE_PATH}[/magenta]")
+            finally:
+                browser.close()
 
     except PlaywrightTimeoutError as e:
         rprint("[bold red]Login failed: Timed out waiting for a page element.[/bold red]")
@@ -202,13 +430,19 @@ def _run_playwright_login_internal(user: str, passw: str, debug: bool) -> bool:
         rprint("It's possible the login failed or the page structure has changed.")
         return False
 
-    found_token = parse_mobile_token(token_url)
+    if not found_token:
+        return False
 
-    if found_token:
-        config.set_tuwel_token(found_token)
-        return True
+    if site_info:
+        userid = site_info.get('userid', 0)
+        config.update(
+            tuwel_token=found_token,
+            tuwel_userid=userid,
+            token_validation=config.token_validation_record(found_token, userid, time.time()),
+        )
     else:
-        return False
+        config.set_tuwel_token(found_token)
+    return True
 
 
 def manual_login():
@@ -230,7 +464,7 @@ def manual_login():
     token = parse_mobile_token(user_input)
 
     # If parsing failed, maybe they pasted the raw token directly?
-    if not token and ":::" not in user_input and "token=" not in user_input:
+    if not token and not _ENCODED_TOKEN_RE.search(user_input):
         token = user_input
 
     if not token:
@@ -240,9 +474,7 @@ def manual_login():
     try:
         client = TuwelClient(token)
         info = client.get_site_info()
-        user_id = info.get('userid', 0)
-        config.set_tuwel_token(token)
-        config.set_user_id(user_id)
+        config.update(tuwel_token=token, tuwel_userid=info.get('userid', 0))
         rprint(f"[bold green]Success![/bold green] Authenticated as [cyan]{info.get('fullname')}[/cyan].")
     except Exception as e:
         rprint(f"[bold red]Authentication failed:[/bold red] {e}")
@@ -262,50 +494,47 @@ def hybrid_login():
     rprint("[dim]Please log in manually. The token will be captured automatically.[/dim]")
     rprint()
 
+    _require_playwright()
+    from playwright.sync_api import Error as PlaywrightError
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
     token_url = ""
 
     try:
         with sync_playwright() as p:
-            storage_state_path = config.config_dir / "browser_state.json"
+            storage_state = _load_storage_state()
 
             browser = p.chromium.launch(headless=False)
-            context = browser.new_context(
-                storage_state=storage_state_path if storage_state_path.exists() else None
-            )
+            context = browser.new_context(storage_state=storage_state)
             page = context.new_page()
 
-            # Listener for the token URL
-            def on_request(request):
-                nonlocal token_url
-                if "moodlemobile://token=" in request.url:
-                    token_url = request.url
-                    rprint(f"[bold green]✓ Token captured![/bold green]")
-
-            page.on("request", on_request)
-
-            # Navigate to the mobile token page which will trigger login
-            page.goto("https://tuwel.tuwien.ac.at/admin/tool/mobile/launch.php?service=moodle_mobile_app&passport=student_api")
-
-            rprint("[yellow]Waiting for you to complete login...[/yellow]")
-            rprint("[dim]The browser will close automatically once the token is captured.[/dim]")
-
-            # Poll for token capture - wait up to 5 minutes (manual login can take time)
+            # Wait for the token request - up to 5 minutes (manual login can take time)
             timeout_seconds = 300
-            end_time = time.time() + timeout_seconds
-            while time.time() < end_time:
-                if token_url:
-                    break
-                try:
-                    page.wait_for_timeout(500)
-                except Exception:
-                    # Page may be closed or navigating
-                    if token_url:
-                        break
-                    continue
+            try:
+                with page.expect_request(_is_token_request, timeout=timeout_seconds * 1000) as request_info:
+                    # Navigate to the mobile token page which will trigger login
+                    try:
+                        page.goto(_LAUNCH_URL, wait_until="commit")
+                    except PlaywrightError as e:
+                        # An existing session redirects straight to moodlemobile://,
+                        # which aborts the navigation; anything else is a real failure
+                        if "net::ERR_ABORTED" not in str(e):
+                            rprint(f"[bold red]Could not open the TUWEL login page:[/bold red] {e}")
+                            raise
+
+                    rprint("[yellow]Waiting for you to complete login...[/yellow]")
+                    rprint("[dim]The browser will close automatically once the token is captured.[/dim]")
+                token_url = request_info.value.url
+                rprint(f"[bold green]✓ Token captured![/bold green]")
+            except PlaywrightError:
+                # Timed out, the user closed the browser window, or the
+                # navigation failed (already reported above)
+                pass
 
             # Save session state
             try:
-                context.storage_state(path=storage_state_path)
+                _save_storage_state(context, storage_state)
             except Exception:
                 pass  # May fail if browser was closed
 
@@ -326,13 +555,15 @@ def hybrid_login():
     found_token = parse_mobile_token(token_url)
 
     if found_token:
-        config.set_tuwel_token(found_token)
         try:
             client = TuwelClient(found_token)
             info = client.get_site_info()
-            config.set_user_id(info.get('userid', 0))
-            rprint(f"[bold green]Success![/bold green] Authenticated as [cyan]{info.get('fullname')}[/cyan].")
         except Exception as e:
+            config.set_tuwel_token(found_token)
             rprint(f"[yellow]Token saved but validation failed: {e}[/yellow]")
+        else:
+            # Token and user ID in a single config write
+            config.update(tuwel_token=found_token, tuwel_userid=info.get('userid', 0))
+            rprint(f"[bold green]Success![/bold green] Authenticated as [cyan]{info.get('fullname')}[/cyan].")
     else:
         rprint("[bold red]Failed to parse token from URL.[/bold red]")
@@ -5,21 +5,57 @@ This module provides commands for listing courses, assignments,
 grades, checkmarks, and downloading course materials.
 """
 
-from datetime import datetime
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import dropwhile
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.table import Table
+from rich.text import Text
 
 from tiss_tuwel_cli.clients.tiss import TissClient
-from tiss_tuwel_cli.utils import parse_percentage, strip_html, timestamp_to_date, format_course_name, extract_course_number
+from tiss_tuwel_cli.utils import (
+    build_table, parse_percentage, strip_html, timestamp_to_date, format_course_name, extract_course_number
+)
 
 console = Console()
 tiss = TissClient()
 
+# Number of files downloaded in parallel by the download command
+DOWNLOAD_WORKERS = 8
+
+# Column specs for the tables rendered below, see utils.build_table
+_COURSE_COLUMNS = (
+    ("Course Title", {"style": "cyan", "no_wrap": False}),
+    ("Code", {"style": "dim", "justify": "center"}),
+    ("ID", {"justify": "right", "style": "dim"}),
+)
+_ASSIGNMENT_COLUMNS = (
+    ("Course", {"style": "cyan", "no_wrap": False}),
+    ("Assignment", {"style": "white", "no_wrap": False}),
+    ("Due", {"style": "red"}),
+    ("Status", {"style": "yellow"}),
+)
+_GRADE_COLUMNS = (
+    ("Item", {"style": "white", "no_wrap": False}),
+    ("Grade", {"justify": "right", "style": "cyan"}),
+    ("Range", {"justify": "center", "style": "dim"}),
+    ("Percentage", {"justify": "right", "style": "green"}),
+)
+_CHECKMARK_COLUMNS = (
+    ("Exercise", {"style": "white", "no_wrap": False}),
+    ("Checked", {"justify": "center"}),
+    ("Grade", {"justify": "right", "style": "magenta"}),
+    ("Deadline", {"style": "dim"}),
+)
+
 
 def _resolve_course_names(client, course_ids: list[int]) -> dict[int, str]:
     """
@@ -75,7 +111,7 @@ def _resolve_course_names(client, course_ids: list[int]) -> dict[int, str]:
     return resolved
 
 
-def courses(classification: str = 'inprogress'):
+def courses(classification: str = 'inprogress', refresh: bool = False):
     """
     List enrolled courses.
     
@@ -86,81 +122,82 @@ def courses(classification: str = 'inprogress'):
             - 'past': Completed courses
             - 'inprogress': Currently active courses (default)
             - 'future': Upcoming courses
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     # Import here to avoid circular imports
     from tiss_tuwel_cli.cli import get_tuwel_client
 
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
     with console.status(f"[bold green]Fetching {classification} courses...[/bold green]"):
         enrolled_courses = client.get_enrolled_courses(classification)
 
-    table = Table(title=f"Enrolled Courses ({classification})", expand=True)
-    table.add_column("Course Title", style="cyan", no_wrap=False)
-    table.add_column("Code", style="dim", justify="center")
-    table.add_column("ID", justify="right", style="dim")
-
-    for course in enrolled_courses:
-        # Show full title prominently, shortname as code, ID for reference
-        shortname = course.get('shortname', '')
-        fullname = course.get('fullname', 'Unknown Course')
-        course_num = extract_course_number(shortname)
-        display_name = format_course_name(fullname, course_num)
+    table = build_table(_COURSE_COLUMNS, title=f"Enrolled Courses ({classification})", expand=True)
 
-        table.add_row(
-            display_name,
-            shortname,
-            str(course.get('id'))
+    # Show full title prominently, shortname as code, ID for reference
+    rows = [
+        (
+            format_course_name(course.get('fullname', 'Unknown Course'),
+                               extract_course_number(course.get('shortname', ''))),
+            course.get('shortname', ''),
+            str(course.get('id')),
         )
+        for course in enrolled_courses
+    ]
+    for row in rows:
+        table.add_row(*row)
     console.print(table)
 
 
-def assignments(course_id: Optional[int] = None):
+def assignments(course_id: Optional[int] = None, refresh: bool = False):
     """
     List assignments.
     
     Shows all assignments from enrolled courses, or for a specific course
     if course_id is provided.
+
+    Args:
+        course_id: Optional TUWEL course ID to limit the list to.
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     # Import here to avoid circular imports
     from tiss_tuwel_cli.cli import get_tuwel_client
 
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
     with console.status("[bold green]Fetching assignments...[/bold green]"):
         data = client.get_assignments()
         courses_with_assignments = data.get('courses', [])
 
-    table = Table(title="Assignments", expand=True)
-    table.add_column("Course", style="cyan", no_wrap=False)
-    table.add_column("Assignment", style="white", no_wrap=False)
-    table.add_column("Due", style="red")
-    table.add_column("Status", style="yellow")
+    table = build_table(_ASSIGNMENT_COLUMNS, title="Assignments", expand=True)
 
-    now = datetime.now().timestamp()
-    found_any = False
+    now = int(time.time())
+    cutoff = now - 30 * 86400
 
+    # Flatten to (course, assignment, due) and sort by due date, so old
+    # assignments form a prefix that can be skipped in one pass
+    flat = []
     for course in courses_with_assignments:
         cid = course.get('id')
         if course_id and cid != course_id:
             continue
 
-        found_any = True
         # Use full course name instead of shortname
         shortname = course.get('shortname', '')
         fullname = course.get('fullname', shortname or 'Unknown')
         course_num = extract_course_number(shortname)
         display_name = format_course_name(fullname, course_num)
-        for assign in course.get('assignments', []):
-            due = assign.get('duedate', 0)
-            if due < now - (30 * 86400):
-                continue  # Skip old assignments
+        flat.extend((display_name, assign.get('name'), assign.get('duedate', 0))
+                    for assign in course.get('assignments', []))
 
-            status = "Closed" if due < now else "Open"
-            table.add_row(
-                display_name,
-                assign.get('name'),
-                timestamp_to_date(due),
-                status
-            )
+    flat.sort(key=itemgetter(2))
+    recent = dropwhile(lambda row: row[2] < cutoff, flat)  # Skip old assignments
+
+    for display_name, name, due in recent:
+        status = "Closed" if due < now else "Open"
+        table.add_row(display_name, name, timestamp_to_date(due), status)
     console.print(table)
 
 
@@ -186,32 +223,22 @@ def grades(course_id: Optional[int] = None):
         return
 
     with console.status("[bold green]Fetching detailed grades...[/bold green]"):
-        report = client.get_user_grades_table(course_id, user_id)
+        grade_rows = client.get_grade_rows(course_id, user_id)
 
-    tables = report.get('tables', [])
-    if not tables:
+    if grade_rows is None:
         rprint("[red]No grade table found for this course.[/red]")
         return
 
-    table_data = tables[0].get('tabledata', [])
-
-    table_data = tables[0].get('tabledata', [])
-
     course_id = int(course_id)
     # Smartly resolve course name
     course_names = _resolve_course_names(client, [course_id])
     display_name = course_names.get(course_id, f"Course {course_id}")
 
     # Create a clean table
-    table = Table(title=f"Grades for {display_name}", expand=True)
-    table.add_column("Item", style="white", no_wrap=False)
-    table.add_column("Grade", justify="right", style="cyan")
-    table.add_column("Range", justify="center", style="dim")
-    table.add_column("Percentage", justify="right", style="green")
-
-    for item in table_data:
-        # Extract text from the itemname dictionary
-        raw_name = item.get('itemname', {}).get('content', '')
+    table = build_table(_GRADE_COLUMNS, title=f"Grades for {display_name}", expand=True)
+
+    for row in grade_rows:
+        raw_name = row.name
         if not raw_name:
             continue
 
@@ -221,25 +248,21 @@ def grades(course_id: Optional[int] = None):
             continue
 
         # Grade Values - clean HTML from all values
-        grade_raw = item.get('grade', {}).get('content', '-')
-        grade_val = strip_html(grade_raw) if grade_raw else '-'
-
-        percent_raw = item.get('percentage', {}).get('content', '-')
-        percent_val = strip_html(percent_raw) if percent_raw else '-'
-
-        range_raw = item.get('range', {}).get('content', '-')
-        range_val = strip_html(range_raw) if range_raw else '-'
+        grade_val = strip_html(row.grade) if row.grade else '-'
+        percent_val = strip_html(row.percentage) if row.percentage else '-'
+        range_val = strip_html(row.grade_range) if row.grade_range else '-'
 
         # Determine row style
-        if "gesamt" in clean_name.lower() or "total" in clean_name.lower():
+        lowered_name = clean_name.lower()
+        if "gesamt" in lowered_name or "total" in lowered_name:
             # Category total - highlight
             table.add_row(
-                f"[bold yellow]▸ {clean_name}[/bold yellow]",
-                f"[bold yellow]{grade_val}[/bold yellow]",
-                range_val,
-                f"[bold yellow]{percent_val}[/bold yellow]"
+                Text.assemble(("▸ ", "bold yellow"), (clean_name, "bold yellow")),
+                Text(grade_val, style="bold yellow"),
+                Text(range_val),
+                Text(percent_val, style="bold yellow")
             )
-        elif grade_val != '-' and grade_val.strip():
+        elif grade_val and grade_val != '-':
             # Regular grade item - use numeric comparison for styling
             style = ""
             pct = parse_percentage(percent_val)
@@ -249,40 +272,41 @@ def grades(course_id: Optional[int] = None):
                 elif pct >= 100.0:
                     style = "green"
 
-            if style:
-                table.add_row(
-                    f"  [{style}]{clean_name}[/{style}]",
-                    f"[{style}]{grade_val}[/{style}]",
-                    range_val,
-                    f"[{style}]{percent_val}[/{style}]"
-                )
-            else:
-                table.add_row(f"  {clean_name}", grade_val, range_val, percent_val)
+            table.add_row(
+                Text(f"  {clean_name}", style=style),
+                Text(grade_val, style=style),
+                Text(range_val),
+                Text(percent_val, style=style)
+            )
         else:
             # Category header or pending item
-            if clean_name.strip():
-                table.add_row(
-                    f"[bold cyan]{clean_name}[/bold cyan]",
-                    "[dim]-[/dim]",
-                    range_val if range_val != '-' else "",
-                    "[dim]-[/dim]"
-                )
+            table.add_row(
+                Text(clean_name, style="bold cyan"),
+                Text("-", style="dim"),
+                Text(range_val if range_val != '-' else ""),
+                Text("-", style="dim")
+            )
 
     console.print(table)
 
 
-def checkmarks():
+def checkmarks(refresh: bool = False):
     """
     Shows status of 'Kreuzerlübung' (mod_checkmark) exercises.
     
     Kreuzerlübungen are a TU Wien-specific exercise format where students
     mark which exercises they have completed before attending the lab session.
     Displays exercises grouped by course with summary statistics.
+
+    Args:
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     # Import here to avoid circular imports
     from tiss_tuwel_cli.cli import get_tuwel_client
 
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
 
     with console.status("[bold green]Looking for checkmark exercises...[/bold green]"):
         try:
@@ -304,43 +328,42 @@ def checkmarks():
         return
 
     # Group checkmarks by course
-    courses_data: Dict[int, Dict[str, Any]] = {}
+    courses_data: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
+        'exercises': [],
+        'total_checked': 0,
+        'total_possible': 0,
+        'total_grade': 0.0,
+        'graded_count': 0
+    })
     for cm in checkmarks_list:
-        course_id = cm.get('course')
+        get = cm.get
+        course_id = get('course')
         if course_id:
             course_id = int(course_id)
+        course_data = courses_data[course_id]
 
-        if course_id not in courses_data:
-            courses_data[course_id] = {
-                'exercises': [],
-                'total_checked': 0,
-                'total_possible': 0,
-                'total_grade': 0.0,
-                'graded_count': 0
-            }
-
-        examples = cm.get('examples', [])
-        checked = sum(1 for ex in examples if ex.get('checked'))
+        examples = get('examples', [])
+        # List comprehension + len() avoids a generator frame per exercise
+        checked = len([ex for ex in examples if ex.get('checked')])
         total = len(examples)
 
-        feedback = cm.get('feedback', {})
-        grade_str = feedback.get('grade', '-')
+        grade_str = (get('feedback') or {}).get('grade', '-')
 
-        courses_data[course_id]['exercises'].append({
-            'name': cm.get('name'),
+        course_data['exercises'].append({
+            'name': get('name'),
             'checked': checked,
             'total': total,
             'grade': grade_str,
-            'deadline': cm.get('cutoffdate', 0)
+            'deadline': get('cutoffdate', 0)
         })
 
-        courses_data[course_id]['total_checked'] += checked
-        courses_data[course_id]['total_possible'] += total
+        course_data['total_checked'] += checked
+        course_data['total_possible'] += total
 
         if grade_str and grade_str != '-':
             try:
-                courses_data[course_id]['total_grade'] += float(grade_str)
-                courses_data[course_id]['graded_count'] += 1
+                course_data['total_grade'] += float(grade_str)
+                course_data['graded_count'] += 1
             except ValueError:
                 pass
 
@@ -366,26 +389,22 @@ def checkmarks():
         rprint(summary)
 
         # Exercise table for this course
-        table = Table(expand=True, show_header=True, header_style="bold", box=None)
-        table.add_column("Exercise", style="white", no_wrap=False)
-        table.add_column("Checked", justify="center")
-        table.add_column("Grade", justify="right", style="magenta")
-        table.add_column("Deadline", style="dim")
+        table = build_table(_CHECKMARK_COLUMNS, expand=True, show_header=True, header_style="bold", box=None)
 
         for ex in data['exercises']:
             checked_str = f"{ex['checked']}/{ex['total']}"
             if ex['checked'] == ex['total']:
-                checked_str = f"[green]{checked_str} ✓[/green]"
+                checked_cell = Text(f"{checked_str} ✓", style="green")
             elif ex['checked'] > 0:
-                checked_str = f"[yellow]{checked_str}[/yellow]"
+                checked_cell = Text(checked_str, style="yellow")
             else:
-                checked_str = f"[red]{checked_str}[/red]"
+                checked_cell = Text(checked_str, style="red")
 
             deadline = timestamp_to_date(ex['deadline']) if ex['deadline'] else "No deadline"
 
             table.add_row(
-                ex['name'],
-                checked_str,
+                Text(ex['name'] or ''),
+                checked_cell,
                 str(ex['grade']),
                 deadline
             )
@@ -394,6 +413,22 @@ def checkmarks():
         rprint()  # Space between courses
 
 
+def _unique_file_name(file_name: str, taken: set) -> str:
+    """
+    Return a file name not yet in ``taken`` and add it to the set.
+
+    Duplicates get a numeric suffix, e.g. "slides (2).pdf".
+    """
+    unique = file_name
+    stem, suffix = Path(file_name).stem, Path(file_name).suffix
+    n = 1
+    while unique in taken:
+        n += 1
+        unique = f"{stem} ({n}){suffix}"
+    taken.add(unique)
+    return unique
+
+
 def download(course_id: int):
     """
     Download all resources (files) from a specific course.
@@ -421,8 +456,11 @@ def download(course_id: int):
     dl_dir.mkdir(parents=True, exist_ok=True)
     rprint(f"Downloading to: [blue]{dl_dir}[/blue]")
 
-    # Iterate and download files
-    count = 0
+    # Collect all files first, then download them concurrently. Sections
+    # often reuse names like "Angabe.pdf", so every file gets its own target
+    # path - parallel writes to the same file would corrupt it.
+    pending = []
+    taken = set()
     for section in contents:
         for module in section.get('modules', []):
             if 'contents' in module:
@@ -431,12 +469,30 @@ def download(course_id: int):
                         file_url = file_info.get('fileurl')
                         file_name = file_info.get('filename')
                         if file_url and file_name:
-                            rprint(f" - Downloading {file_name}...")
-                            try:
-                                client.download_file(file_url, dl_dir / file_name)
-                                count += 1
-                            except Exception as e:
-                                rprint(f"   [red]Failed:[/red] {e}")
+                            file_name = _unique_file_name(file_name, taken)
+                            pending.append((file_url, file_name, file_info.get('filesize') or 0))
+
+    count = 0
+    with Progress(console=console) as progress, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        # Track bytes rather than files, so one large video does not look stuck
+        total_bytes = sum(size for _, _, size in pending)
+        task = progress.add_task("[cyan]Downloading files...", total=total_bytes or None)
+
+        def advance(nbytes: int) -> None:
+            progress.advance(task, nbytes)
+
+        futures = {
+            pool.submit(client.download_file, file_url, dl_dir / file_name, advance): file_name
+            for file_url, file_name, _ in pending
+        }
+        for future in as_completed(futures):
+            file_name = futures[future]
+            try:
+                future.result()
+                count += 1
+                progress.console.print(f" - Downloaded {file_name}")
+            except Exception as e:
+                progress.console.print(f" - [red]Failed:[/red] {file_name}: {e}")
 
     rprint(f"[bold green]Done! Downloaded {count} files.[/bold green]")
 
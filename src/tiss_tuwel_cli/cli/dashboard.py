@@ -5,89 +5,122 @@ This module provides the main dashboard view showing upcoming
 events and deadlines from both TUWEL and TISS with enhanced visuals.
 """
 
+import bisect
+import functools
+import time
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
 from tiss_tuwel_cli.clients.tiss import TissClient
-from tiss_tuwel_cli.utils import timestamp_to_date, format_course_name, extract_course_number
+from tiss_tuwel_cli.utils import build_table, timestamp_to_date, format_course_name, extract_course_number
 
 console = Console()
 tiss = TissClient()
 
-
-def dashboard():
+# Number of upcoming TUWEL deadlines shown by the dashboard
+DEADLINE_ROWS = 15
+
+# Columns of the deadlines table, see utils.build_table
+_DEADLINE_COLUMNS = (
+    ("Course", {"style": "cyan", "no_wrap": False}),
+    ("Event", {"style": "white", "no_wrap": False}),
+    ("Date", {"style": "green"}),
+    ("Urgency", {"justify": "center"}),
+)
+
+# Urgency tiers for deadlines: days left below 0, 1, 3 and 7, then the rest.
+# Looked up with bisect, each tier is (date style, urgency cell).
+_URGENCY_THRESHOLDS = (0, 1, 3, 7)
+_URGENCY_TIERS = (
+    ("red", "[red]⚠️ Overdue[/red]"),
+    ("bold red", "[bold red]🔥 Today![/bold red]"),
+    ("yellow", "[yellow]⏰ Soon[/yellow]"),
+    ("green", "[green]📌 This Week[/green]"),
+    ("dim", "[dim]✓ OK[/dim]"),
+)
+
+# Same for the weekly overview: (style, icon) for events due in less than
+# 1 day, less than 2 days and later. Exams are always highlighted.
+_WEEKLY_THRESHOLDS = (1, 2)
+_WEEKLY_TIERS = (("bold red", "🔥"), ("yellow", "⏰"), ("white", "📌"))
+_WEEKLY_EXAM_TIER = ("bold magenta", "🎓")
+
+
+@functools.lru_cache(maxsize=256)
+def _iso_to_ts(date_str: str) -> float:
+    """Convert a TISS ISO date string to a timestamp (cached, exam dates repeat per course)."""
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None).timestamp()
+
+
+def dashboard(refresh: bool = False):
     """
     Overview of upcoming events with enhanced visuals.
     
-    Shows upcoming TUWEL deadlines and TISS public events in a
-    formatted view with color-coded urgency and progress indicators.
+    Shows upcoming TUWEL deadlines in a formatted view with
+    color-coded urgency indicators.
+
+    Args:
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     # Import here to avoid circular imports
     from tiss_tuwel_cli.cli import get_tuwel_client
 
     client = get_tuwel_client()
-    with console.status("[bold green]Fetching data...[/bold green]"):
-        try:
-            upcoming = client.get_upcoming_calendar()
-            events = upcoming.get('events', [])
-            tiss_events = tiss.get_public_events()
-        except Exception as e:
-            rprint(f"[bold red]Error:[/bold red] {e}")
-            return
+    if refresh:
+        client.clear_cache()
 
-    # Display header
+    # Display header right away instead of after all requests finished
     console.print()
     console.print(Panel(
         "[bold cyan]📊 Your TU Wien Dashboard[/bold cyan]\n"
-        "[dim]Showing upcoming deadlines and events from TUWEL and TISS[/dim]",
+        "[dim]Showing upcoming deadlines from TUWEL[/dim]",
         border_style="cyan"
     ))
     console.print()
 
+    with console.status("[bold green]Fetching deadlines...[/bold green]"):
+        try:
+            events = client.get_upcoming_calendar().get('events', [])
+        except Exception as e:
+            rprint(f"[bold red]Error:[/bold red] {e}")
+            return
+
     # TUWEL Deadlines Table with urgency colors
-    tuwel_table = Table(
+    _print_deadlines(events)
+
+
+def _print_deadlines(events: list):
+    """Print the TUWEL deadlines table with color-coded urgency."""
+    tuwel_table = build_table(
+        _DEADLINE_COLUMNS,
         title="[bold blue]📅 Upcoming TUWEL Deadlines[/bold blue]",
         expand=True,
         show_header=True,
         header_style="bold cyan"
     )
-    tuwel_table.add_column("Course", style="cyan", no_wrap=False)
-    tuwel_table.add_column("Event", style="white", no_wrap=False)
-    tuwel_table.add_column("Date", style="green")
-    tuwel_table.add_column("Urgency", justify="center")
 
-    now = datetime.now().timestamp()
-    for event in events[:15]:  # Show more events
-        event_time = event.get('timestart', 0)
-        days_left = (event_time - now) / 86400
+    # Urgency tier boundaries as absolute timestamps, so rows need no division
+    now = time.time()
+    boundaries = [now + days * 86400 for days in _URGENCY_THRESHOLDS]
+    for event in islice(events, DEADLINE_ROWS):
+        get = event.get
+        event_time = get('timestart', 0)
 
         # Determine urgency indicator
-        if days_left < 0:
-            urgency = "[red]⚠️ Overdue[/red]"
-            date_style = "red"
-        elif days_left < 1:
-            urgency = "[bold red]🔥 Today![/bold red]"
-            date_style = "bold red"
-        elif days_left < 3:
-            urgency = "[yellow]⏰ Soon[/yellow]"
-            date_style = "yellow"
-        elif days_left < 7:
-            urgency = "[green]📌 This Week[/green]"
-            date_style = "green"
-        else:
-            urgency = "[dim]✓ OK[/dim]"
-            date_style = "dim"
-
-        course_info = event.get('course', {})
+        date_style, urgency = _URGENCY_TIERS[bisect.bisect_right(boundaries, event_time)]
+
+        course_info = get('course') or {}
         shortname = course_info.get('shortname', '')
         fullname = course_info.get('fullname', shortname or 'Unknown Course')
         course_name = format_course_name(fullname, extract_course_number(shortname))
 
-        event_name = event.get('name', 'Unknown Event')
+        event_name = get('name', 'Unknown Event')
         date_str = timestamp_to_date(event_time)
 
         tuwel_table.add_row(
@@ -100,37 +133,16 @@ def dashboard():
     console.print(tuwel_table)
     console.print()
 
-    # Study progress overview
-    try:
-        from tiss_tuwel_cli.cli.features import get_study_progress
-        progress_data = get_study_progress(client)
-
-        total_assignments = progress_data.get('checkmarks_total', 0)  # Wait, get_study_progress returns checkmarksstats and assignment counts
-        # Actually dashboard was doing assignment completion bar.
-        # get_study_progress returns 'pending_assignments', 'overdue_assignments'. 
-        # It doesn't return total assignments count directly in a way to calc % if we don't know completed.
-        # Let's check get_study_progress implementation again.
-        # It calculates pending and overdue. It does NOT return total assignments count or completed count explicitly.
-        # But dashboard wants a progress bar.
-        # Interactive mode used get_study_progress to show "Pending: X".
-        # Dashboard shows "Assignment Completion X%".
-        # I should update get_study_progress to return total/completed too.
-        pass
-    except Exception:
-        pass
-
-    # ... restoring original logic for now until I fix features.py ...
-    # Actually, I should update features.py first to return what dashboard needs.
-    # Refactoring dashboard.py to use `get_study_progress` implies `get_study_progress` is sufficient.
-    # Let's add weekly_overview first.
-
-
-def weekly_overview():
+
+def weekly_overview(refresh: bool = False):
     """
     Show events and deadlines for the upcoming week.
     
     Displays a day-by-day breakdown of all events in the next 7 days,
     including TUWEL deadlines and TISS exam dates.
+
+    Args:
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     from tiss_tuwel_cli.cli import get_tuwel_client
     from tiss_tuwel_cli.cli.features import get_weekly_events, get_exam_alerts
@@ -138,6 +150,8 @@ def weekly_overview():
     from collections import defaultdict
 
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
 
     with console.status("[bold green]Fetching weekly events...[/bold green]"):
         weekly = get_weekly_events(client)
@@ -156,14 +170,14 @@ def weekly_overview():
         })
 
     # Add exam dates from TISS that are within this week
-    now = datetime.now().timestamp()
+    now = time.time()
     week_later = now + (7 * 86400)
 
     for alert in exam_alerts:
         exam_date_str = alert.get('exam_date')
         if exam_date_str:
             try:
-                exam_time = datetime.fromisoformat(exam_date_str.replace('Z', '+00:00')).replace(tzinfo=None).timestamp()
+                exam_time = _iso_to_ts(exam_date_str)
                 if now <= exam_time <= week_later:
                     all_events.append({
                         'type': 'exam',
@@ -181,43 +195,39 @@ def weekly_overview():
         rprint("[green]🎉 Enjoy your free week![/green]")
         return
 
-    # Group by day
+    # Group by local day first, then sort only within each (small) day
     by_day = defaultdict(list)
-
-    for event in sorted(all_events, key=lambda x: x['timestart']):
-        event_time = event.get('timestart', 0)
-        day = datetime.fromtimestamp(event_time).strftime('%A, %b %d')
+    day_labels = {}
+
+    for event in all_events:
+        # Convert once per event and derive both the day and the time
+        lt = time.localtime(event.get('timestart', 0))
+        event['time_str'] = "%02d:%02d" % (lt.tm_hour, lt.tm_min)
+        day = (lt.tm_year, lt.tm_yday)
+        if day not in day_labels:
+            day_labels[day] = time.strftime('%A, %b %d', lt)
         by_day[day].append(event)
 
     console.print(Panel("[bold blue]📅 Weekly Overview[/bold blue]", expand=False))
     console.print()
 
     # Display events grouped by day
-    for day, events in by_day.items():
-        console.print(f"[bold cyan]📅 {day}[/bold cyan]")
-        for event in events:
+    boundaries = [now + days * 86400 for days in _WEEKLY_THRESHOLDS]
+    for day in sorted(by_day):
+        console.print(f"[bold cyan]📅 {day_labels[day]}[/bold cyan]")
+        for event in sorted(by_day[day], key=itemgetter('timestart')):
             event_name = event.get('name', 'Unknown')
             course = event.get('course', '')
             event_time = event.get('timestart', 0)
-            time_str = datetime.fromtimestamp(event_time).strftime('%H:%M')
+            time_str = event['time_str']
             source = event.get('source', '')
             event_type = event.get('type', '')
 
-            days_left = (event_time - now) / 86400
-
             # Different styling for exams vs regular events
             if event_type == 'exam':
-                style = "bold magenta"
-                icon = "🎓"
-            elif days_left < 1:
-                style = "bold red"
-                icon = "🔥"
-            elif days_left < 2:
-                style = "yellow"
-                icon = "⏰"
+                style, icon = _WEEKLY_EXAM_TIER
             else:
-                style = "white"
-                icon = "📌"
+                style, icon = _WEEKLY_TIERS[bisect.bisect_right(boundaries, event_time)]
 
             console.print(
                 f"   {icon} [{style}]{time_str}[/{style}] "
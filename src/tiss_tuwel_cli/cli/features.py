@@ -9,15 +9,20 @@ This module provides advanced features and shared data aggregation logic:
 - Weekly event aggregation
 """
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import bisect
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter, le
+from typing import Optional, Iterator, List, Dict, Any
 
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from tiss_tuwel_cli.utils import days_until, extract_course_number
+from tiss_tuwel_cli.utils import checkmark_totals, days_until, extract_course_number, summarize_assignments
 
 console = Console()
 
@@ -25,6 +30,8 @@ console = Console()
 SECONDS_PER_DAY = 86400
 EXAM_ALERT_DAYS_BEFORE = 14  # Show alerts for registrations opening within this many days
 EXAM_ALERT_DAYS_AFTER = 7  # Show alerts for registrations that opened within this many days
+EXAM_FETCH_WORKERS = 8  # Parallel TISS requests when collecting exam dates
+UNIFIED_VIEW_WORKERS = 8  # Courses fetched in parallel by the unified course view
 
 
 def export_calendar(output_file: Optional[str] = None):
@@ -64,57 +71,67 @@ def get_exam_alerts(client, tiss_client) -> List[dict]:
     except Exception:
         return []
 
-    # For each course, try to extract course number and fetch exam dates
+    # Only courses with a recognizable course number can be looked up in TISS
+    lookups = []
     for course in courses:
-        shortname = course.get('shortname', '')
-        course_num = extract_course_number(shortname)
+        course_num = extract_course_number(course.get('shortname', ''))
+        if course_num:
+            lookups.append((course, course_num))
 
-        if not course_num:
-            continue
+    def fetch_exam_dates(course_num: str):
+        try:
+            return tiss_client.get_exam_dates(course_num)
+        except Exception:
+            # Skip courses that fail - don't let one failure break the loop
+            return None
 
+    # The requests are independent, so wait for them concurrently
+    with ThreadPoolExecutor(max_workers=EXAM_FETCH_WORKERS) as pool:
+        results = list(pool.map(fetch_exam_dates, [course_num for _, course_num in lookups]))
+
+    for (course, _), exams in zip(lookups, results):
+        if not isinstance(exams, list):
+            continue
         try:
-            exams = tiss_client.get_exam_dates(course_num)
-            if isinstance(exams, dict) and 'error' in exams:
-                continue
-            if not isinstance(exams, list):
-                continue
-
-            for exam in exams:
-                reg_start = exam.get('registrationStart')
-                reg_end = exam.get('registrationEnd')
-                exam_date = exam.get('date')
-
-                if reg_start:
-                    days_to_reg = days_until(reg_start)
-                    days_to_exam = days_until(exam_date) if exam_date else None
-
-                    # Alert if registration starts within configured days
-                    # or is currently open (reg_start passed but reg_end not)
-                    if days_to_reg is not None:
-                        if -EXAM_ALERT_DAYS_AFTER <= days_to_reg <= EXAM_ALERT_DAYS_BEFORE:
-                            alert = {
-                                'course': shortname,
-                                'course_fullname': course.get('fullname', shortname),
-                                'exam_date': exam_date,
-                                'registration_start': reg_start,
-                                'registration_end': reg_end,
-                                'days_to_registration': days_to_reg,
-                                'days_to_exam': days_to_exam,
-                                'mode': exam.get('mode', 'Unknown'),
-                            }
-                            alerts.append(alert)
+            alerts.extend(_exam_alerts_for_course(course, exams))
         except Exception:
             # Skip courses that fail - don't let one failure break the loop
             continue
 
-    # Sort by registration start date (soonest first)
-    alerts.sort(
-        key=lambda x: x.get('days_to_registration', 999)
-    )
+    # Sort by registration start date (soonest first); every alert has the key
+    alerts.sort(key=itemgetter('days_to_registration'))
 
     return alerts
 
 
+def _exam_alerts_for_course(course: dict, exams: List[dict]) -> Iterator[dict]:
+    """Yield an alert for each exam of a course whose registration is near or open."""
+    shortname = course.get('shortname', '')
+
+    for exam in exams:
+        reg_start = exam.get('registrationStart')
+        if not reg_start:
+            continue
+
+        # Alert if registration starts within configured days
+        # or is currently open (reg_start passed but reg_end not)
+        days_to_reg = days_until(reg_start)
+        if days_to_reg is None or not -EXAM_ALERT_DAYS_AFTER <= days_to_reg <= EXAM_ALERT_DAYS_BEFORE:
+            continue
+
+        exam_date = exam.get('date')
+        yield {
+            'course': shortname,
+            'course_fullname': course.get('fullname', shortname),
+            'exam_date': exam_date,
+            'registration_start': reg_start,
+            'registration_end': exam.get('registrationEnd'),
+            'days_to_registration': days_to_reg,
+            'days_to_exam': days_until(exam_date) if exam_date else None,
+            'mode': exam.get('mode', 'Unknown'),
+        }
+
+
 def get_study_progress(client) -> Dict[str, Any]:
     """
     Calculate overall study progress across all courses.
@@ -135,30 +152,17 @@ def get_study_progress(client) -> Dict[str, Any]:
         checkmarks_data = client.get_checkmarks([])
         checkmarks_list = checkmarks_data.get('checkmarks', [])
 
-        total_checked = 0
-        total_possible = 0
-
-        for cm in checkmarks_list:
-            examples = cm.get('examples', [])
-            total_checked += sum(1 for ex in examples if ex.get('checked'))
-            total_possible += len(examples)
+        total_checked, total_possible = checkmark_totals(checkmarks_list)
 
         # Get assignments for pending work
         assignments_data = client.get_assignments()
         courses_with_assignments = assignments_data.get('courses', [])
 
-        now = datetime.now().timestamp()
-        pending_assignments = 0
-        overdue_assignments = 0
-
-        for course in courses_with_assignments:
-            for assign in course.get('assignments', []):
-                due = assign.get('duedate', 0)
-                if due > now:
-                    pending_assignments += 1
-                elif due > now - (7 * SECONDS_PER_DAY):
-                    # Overdue within last week
-                    overdue_assignments += 1
+        # Overdue only counts deadlines missed within the last week
+        pending_assignments, overdue_assignments = summarize_assignments(
+            chain.from_iterable(c.get('assignments', []) for c in courses_with_assignments),
+            overdue_days=7
+        )
 
         return {
             'checkmarks_completed': total_checked,
@@ -188,16 +192,15 @@ def get_weekly_events(client) -> List[dict]:
         events = upcoming.get('events', [])
 
         # Filter to next 7 days
-        now = datetime.now().timestamp()
+        now = time.time()
         week_later = now + (7 * SECONDS_PER_DAY)
 
-        weekly = []
-        for event in events:
-            event_time = event.get('timestart', 0)
-            if now <= event_time <= week_later:
-                weekly.append(event)
-
-        return weekly
+        # The upcoming view is normally ordered by start time; if so, the
+        # window is cut out with two bisects, otherwise every event is checked
+        times = [event.get('timestart', 0) for event in events]
+        if all(map(le, times, islice(times, 1, None))):
+            return events[bisect.bisect_left(times, now):bisect.bisect_right(times, week_later)]
+        return [event for event, event_time in zip(events, times) if now <= event_time <= week_later]
     except Exception:
         return []
 
@@ -320,14 +323,11 @@ def course_statistics(course_id: Optional[int] = None):
 
     if course_assignments:
         assigns = course_assignments.get('assignments', [])
-        now = datetime.now().timestamp()
-
-        pending = [a for a in assigns if a.get('duedate', 0) > now]
-        completed = [a for a in assigns if a.get('duedate', 0) <= now]
+        pending, _ = summarize_assignments(assigns)
 
         rprint("[bold]📝 Assignments[/bold]")
-        rprint(f"  Pending: [yellow]{len(pending)}[/yellow]")
-        rprint(f"  Completed: [green]{len(completed)}[/green]")
+        rprint(f"  Pending: [yellow]{pending}[/yellow]")
+        rprint(f"  Completed: [green]{len(assigns) - pending}[/green]")
         rprint(f"  Total: [cyan]{len(assigns)}[/cyan]")
         rprint()
 
@@ -336,13 +336,7 @@ def course_statistics(course_id: Optional[int] = None):
     course_checkmarks = [cm for cm in checkmarks_list if cm.get('course') == course_id]
 
     if course_checkmarks:
-        total_checked = 0
-        total_possible = 0
-
-        for cm in course_checkmarks:
-            examples = cm.get('examples', [])
-            total_checked += sum(1 for ex in examples if ex.get('checked'))
-            total_possible += len(examples)
+        total_checked, total_possible = checkmark_totals(course_checkmarks)
 
         completion = (total_checked / total_possible * 100) if total_possible > 0 else 0
 
@@ -369,7 +363,7 @@ def course_statistics(course_id: Optional[int] = None):
     rprint("[dim]💡 Tip: Use this information to plan your study time effectively![/dim]")
 
 
-def unified_course_view(course_id: Optional[int] = None):
+def unified_course_view(course_id: Optional[int] = None, refresh: bool = False):
     """
     Show a unified view combining TISS and TUWEL data for courses.
     
@@ -379,12 +373,15 @@ def unified_course_view(course_id: Optional[int] = None):
     
     Args:
         course_id: Optional specific course ID. If omitted, shows all current courses.
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     from tiss_tuwel_cli.cli import get_tuwel_client
     from tiss_tuwel_cli.clients.tiss import TissClient
-    from tiss_tuwel_cli.utils import extract_course_number, get_current_semester, timestamp_to_date, format_course_name
+    from tiss_tuwel_cli.utils import extract_course_number, get_current_semester, format_course_name
 
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
     tiss = TissClient()
 
     if course_id:
@@ -404,15 +401,48 @@ def unified_course_view(course_id: Optional[int] = None):
         return
 
     semester = get_current_semester()
+    now = time.time()
 
-    for course in courses:
+    def fetch_panels(course):
+        if assignments_error is not None:
+            tuwel_content = f"[dim]Error fetching TUWEL data: {str(assignments_error)[:50]}[/dim]"
+        else:
+            cid = course.get('id')
+            tuwel_content = _tuwel_course_content(assignments_by_id.get(cid, []), checkmarks_by_id.get(cid, []), now)
+        return _tiss_course_content(tiss, extract_course_number(course.get('shortname', '')), semester), tuwel_content
+
+    with console.status("[bold green]Fetching TISS and TUWEL data...[/bold green]"):
+        # Assignments come back for all courses at once - fetch them a single time
+        try:
+            assignments_data = client.get_assignments()
+            assignments_error = None
+        except Exception as e:
+            assignments_data = {}
+            assignments_error = e
+        assignments_by_id = {
+            c.get('id'): c.get('assignments', []) for c in assignments_data.get('courses', [])
+        }
+
+        # Same for checkmarks (the per-course lookup only filters client-side)
+        checkmarks_by_id: Dict[int, List[dict]] = defaultdict(list)
+        try:
+            for cm in client.get_checkmarks([]).get('checkmarks', []):
+                if cm.get('course'):
+                    checkmarks_by_id[int(cm['course'])].append(cm)
+        except Exception:
+            pass  # Checkmarks not available for all courses
+
+        # Every course needs several independent requests - run the courses concurrently
+        with ThreadPoolExecutor(max_workers=UNIFIED_VIEW_WORKERS) as pool:
+            panels = list(pool.map(fetch_panels, courses))
+
+    from rich.columns import Columns
+
+    for course, (tiss_content, tuwel_content) in zip(courses, panels):
         cid = course.get('id')
         fullname = course.get('fullname', 'Unknown')
         shortname = course.get('shortname', '')
-
-        # Extract course number and try to fetch TISS data
-        course_num = extract_course_number(shortname)
-        display_name = format_course_name(fullname, course_num)
+        display_name = format_course_name(fullname, extract_course_number(shortname))
 
         console.print()
         console.print(f"[bold cyan]{'=' * 80}[/bold cyan]")
@@ -420,93 +450,7 @@ def unified_course_view(course_id: Optional[int] = None):
         console.print(f"[dim]TUWEL ID: {cid} | Code: {shortname}[/dim]")
         console.print()
 
-        # Create side-by-side panels
-        tiss_content = ""
-        tuwel_content = ""
-
-        # Fetch TISS data
-        if course_num:
-            tiss_content += f"[bold]Course Number:[/bold] {course_num}\n"
-            try:
-                details = tiss.get_course_details(course_num, semester)
-                if details and 'error' not in details:
-                    ects = details.get('ects', 'N/A')
-                    course_type = details.get('courseType', {})
-                    type_name = course_type.get('name') if isinstance(course_type, dict) else 'N/A'
-
-                    tiss_content += f"[bold]ECTS:[/bold] {ects}\n"
-                    tiss_content += f"[bold]Type:[/bold] {type_name}\n"
-
-                    # Get exam dates
-                    exams = tiss.get_exam_dates(course_num)
-                    if isinstance(exams, list) and exams:
-                        tiss_content += f"\n[bold cyan]📅 Upcoming Exams:[/bold cyan]\n"
-                        for exam in exams[:3]:
-                            date = exam.get('date', 'N/A')
-                            mode = exam.get('mode', 'Unknown')
-                            tiss_content += f"  • {date} - {mode}\n"
-                    else:
-                        tiss_content += "\n[dim]No exam dates available[/dim]"
-                else:
-                    tiss_content += "[dim]Course details not found in TISS[/dim]"
-            except Exception as e:
-                tiss_content += f"[dim]Error fetching TISS data: {str(e)[:50]}[/dim]"
-        else:
-            tiss_content = "[dim]Course number not found\nCannot fetch TISS data[/dim]"
-
-        # Fetch TUWEL data - assignments
-        try:
-            assignments_data = client.get_assignments()
-            course_assignments = []
-            for c in assignments_data.get('courses', []):
-                if c.get('id') == cid:
-                    course_assignments = c.get('assignments', [])
-                    break
-
-            if course_assignments:
-                now = datetime.now().timestamp()
-                pending = [a for a in course_assignments if a.get('duedate', 0) > now]
-                overdue = [a for a in course_assignments if a.get('duedate', 0) < now and a.get('duedate', 0) > now - (30 * 86400)]
-
-                tuwel_content += f"[bold cyan]📝 Assignments:[/bold cyan]\n"
-                tuwel_content += f"  Pending: [yellow]{len(pending)}[/yellow]\n"
-                tuwel_content += f"  Overdue: [red]{len(overdue)}[/red]\n"
-
-                if pending:
-                    tuwel_content += "\n[bold]Next Deadlines:[/bold]\n"
-                    for a in sorted(pending, key=lambda x: x.get('duedate', 0))[:3]:
-                        name = a.get('name', 'Unknown')
-                        due_str = timestamp_to_date(a.get('duedate'))
-                        tuwel_content += f"  • {name}\n    [dim]{due_str}[/dim]\n"
-            else:
-                tuwel_content += "[bold cyan]📝 Assignments:[/bold cyan]\n"
-                tuwel_content += "[dim]No assignments found[/dim]\n"
-
-            # Try to get checkmarks
-            try:
-                checkmarks_data = client.get_checkmarks([cid])
-                checkmarks = checkmarks_data.get('checkmarks', [])
-                if checkmarks:
-                    total_checked = 0
-                    total_possible = 0
-                    for cm in checkmarks:
-                        examples = cm.get('examples', [])
-                        total_checked += sum(1 for ex in examples if ex.get('checked'))
-                        total_possible += len(examples)
-
-                    if total_possible > 0:
-                        pct = (total_checked / total_possible * 100)
-                        tuwel_content += f"\n[bold cyan]✅ Checkmarks:[/bold cyan]\n"
-                        tuwel_content += f"  Progress: {total_checked}/{total_possible} ([green]{pct:.0f}%[/green])\n"
-            except Exception:
-                pass  # Checkmarks not available for all courses
-
-        except Exception as e:
-            tuwel_content += f"[dim]Error fetching TUWEL data: {str(e)[:50]}[/dim]"
-
         # Display side-by-side panels
-        from rich.columns import Columns
-
         tiss_panel = Panel(tiss_content, title="🔍 TISS Data", border_style="cyan", expand=True)
         tuwel_panel = Panel(tuwel_content, title="📚 TUWEL Data", border_style="green", expand=True)
 
@@ -516,3 +460,69 @@ def unified_course_view(course_id: Optional[int] = None):
     console.print(f"[bold cyan]{'=' * 80}[/bold cyan]")
     console.print()
     rprint("[dim]💡 Use this view to see all information about your courses at a glance![/dim]")
+
+
+def _tiss_course_content(tiss, course_num: Optional[str], semester: str) -> str:
+    """Build the TISS panel text (details and exam dates) of the unified course view."""
+    if not course_num:
+        return "[dim]Course number not found\nCannot fetch TISS data[/dim]"
+
+    tiss_content = f"[bold]Course Number:[/bold] {course_num}\n"
+    try:
+        details = tiss.get_course_details(course_num, semester)
+        if details and 'error' not in details:
+            ects = details.get('ects', 'N/A')
+            course_type = details.get('courseType', {})
+            type_name = course_type.get('name') if isinstance(course_type, dict) else 'N/A'
+
+            tiss_content += f"[bold]ECTS:[/bold] {ects}\n"
+            tiss_content += f"[bold]Type:[/bold] {type_name}\n"
+
+            # Get exam dates
+            exams = tiss.get_exam_dates(course_num)
+            if isinstance(exams, list) and exams:
+                tiss_content += f"\n[bold cyan]📅 Upcoming Exams:[/bold cyan]\n"
+                for exam in exams[:3]:
+                    date = exam.get('date', 'N/A')
+                    mode = exam.get('mode', 'Unknown')
+                    tiss_content += f"  • {date} - {mode}\n"
+            else:
+                tiss_content += "\n[dim]No exam dates available[/dim]"
+        else:
+            tiss_content += "[dim]Course details not found in TISS[/dim]"
+    except Exception as e:
+        tiss_content += f"[dim]Error fetching TISS data: {str(e)[:50]}[/dim]"
+    return tiss_content
+
+
+def _tuwel_course_content(course_assignments: List[dict], checkmarks: List[dict], now: float) -> str:
+    """Build the TUWEL panel text (assignments and checkmarks) of the unified course view."""
+    from tiss_tuwel_cli.utils import timestamp_to_date
+
+    tuwel_content = ""
+    if course_assignments:
+        pending = [a for a in course_assignments if a.get('duedate', 0) > now]
+        overdue = [a for a in course_assignments if a.get('duedate', 0) < now and a.get('duedate', 0) > now - (30 * 86400)]
+
+        tuwel_content += f"[bold cyan]📝 Assignments:[/bold cyan]\n"
+        tuwel_content += f"  Pending: [yellow]{len(pending)}[/yellow]\n"
+        tuwel_content += f"  Overdue: [red]{len(overdue)}[/red]\n"
+
+        if pending:
+            tuwel_content += "\n[bold]Next Deadlines:[/bold]\n"
+            for a in sorted(pending, key=itemgetter('duedate'))[:3]:
+                name = a.get('name', 'Unknown')
+                due_str = timestamp_to_date(a.get('duedate'))
+                tuwel_content += f"  • {name}\n    [dim]{due_str}[/dim]\n"
+    else:
+        tuwel_content += "[bold cyan]📝 Assignments:[/bold cyan]\n"
+        tuwel_content += "[dim]No assignments found[/dim]\n"
+
+    if checkmarks:
+        total_checked, total_possible = checkmark_totals(checkmarks)
+
+        if total_possible > 0:
+            pct = (total_checked / total_possible * 100)
+            tuwel_content += f"\n[bold cyan]✅ Checkmarks:[/bold cyan]\n"
+            tuwel_content += f"  Progress: {total_checked}/{total_possible} ([green]{pct:.0f}%[/green])\n"
+    return tuwel_content
@@ -276,20 +276,23 @@ class InteractiveMenu:
                     console.print()
 
             # ============ UPCOMING DEADLINES ============
+            # Deadlines within a day are counted while rendering, for the tips
+            urgent_count = 0
             if events:
                 console.print("[bold]📅 Upcoming Deadlines[/bold]")
+                now = datetime.now().timestamp()
                 for event in events:
                     course = event.get('course', {}).get('shortname', '')
                     event_name = event.get('name', 'Unknown')
                     time = timestamp_to_date(event.get('timestart'))
                     # Color based on urgency
-                    now = datetime.now().timestamp()
                     event_time = event.get('timestart', 0)
                     days_left = (event_time - now) / SECONDS_PER_DAY
 
                     if days_left < 1:
                         style = "bold red"
                         urgency = "⚠️ "
+                        urgent_count += 1
                     elif days_left < 3:
                         style = "yellow"
                         urgency = "⏰ "
@@ -303,7 +306,7 @@ class InteractiveMenu:
                 console.print()
 
             # ============ SMART TIPS ============
-            tips = self._generate_smart_tips(exam_alerts, progress, events)
+            tips = self._generate_smart_tips(exam_alerts, progress, urgent_count)
             if tips:
                 console.print("[bold]💡 Tips[/bold]")
                 for tip in tips[:2]:
@@ -318,7 +321,7 @@ class InteractiveMenu:
             self,
             exam_alerts: List[dict],
             progress: Dict[str, Any],
-            events: List[dict]
+            urgent_count: int
     ) -> List[str]:
         """Generate context-aware tips for the student."""
         tips = []
@@ -342,11 +345,8 @@ class InteractiveMenu:
                 tips.append("✏️ Keep working on your checkmarks to meet participation requirements.")
 
         # Deadline-related tips
-        if events:
-            now = datetime.now().timestamp()
-            urgent = [e for e in events if (e.get('timestart', 0) - now) < SECONDS_PER_DAY]
-            if urgent:
-                tips.append(f"⏰ You have {len(urgent)} deadline(s) in the next 24 hours!")
+        if urgent_count:
+            tips.append(f"⏰ You have {urgent_count} deadline(s) in the next 24 hours!")
 
         # General tips (if no specific tips)
         if not tips:
@@ -11,6 +11,7 @@ from rich import print as rprint
 from rich.console import Console
 
 from tiss_tuwel_cli.config import ConfigManager
+from tiss_tuwel_cli.utils import checkmark_totals
 
 console = Console()
 config = ConfigManager()
@@ -168,13 +169,7 @@ def _get_progress(client) -> str:
         checkmarks = client.get_checkmarks([])
         checkmarks_list = checkmarks.get('checkmarks', [])
 
-        total_checked = 0
-        total_possible = 0
-
-        for cm in checkmarks_list:
-            examples = cm.get('examples', [])
-            total_checked += sum(1 for ex in examples if ex.get('checked'))
-            total_possible += len(examples)
+        total_checked, total_possible = checkmark_totals(checkmarks_list)
 
         if total_possible > 0:
             pct = (total_checked / total_possible) * 100
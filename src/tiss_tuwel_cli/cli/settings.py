@@ -168,11 +168,18 @@ def run_wizard():
 
         if save_creds:
             from rich.prompt import Prompt
-            rprint("\n[bold yellow]Warning:[/bold yellow] Credentials will be stored in plain text.")
+            in_keyring = config.uses_keyring
+            if in_keyring:
+                rprint("\nYour password will be stored in the system keyring.")
+            else:
+                rprint("\n[bold yellow]Warning:[/bold yellow] Credentials will be stored in plain text.")
             user = Prompt.ask("Enter TUWEL Username")
             passw = Prompt.ask("Enter TUWEL Password", password=True)
-            config.set_login_credentials(user, passw)
-            rprint("[green]Credentials saved.[/green]")
+            if config.set_login_credentials(user, passw) or not in_keyring:
+                rprint("[green]Credentials saved.[/green]")
+            else:
+                rprint("[bold yellow]Warning:[/bold yellow] The system keyring could not be used, the password was stored in plain text.")
+                rprint(f"Location: {config.config_file}")
 
     config.set_setting("wizard_completed", True)
     console.print()
@@ -188,6 +195,8 @@ def clear_credentials():
     ).execute()
 
     if confirm:
+        from tiss_tuwel_cli.cli import clear_tuwel_cache
+        clear_tuwel_cache()
         config.clear_credentials()
         rprint("[green]Credentials deleted.[/green]")
     else:
@@ -204,6 +213,8 @@ def clear_token():
     ).execute()
 
     if confirm:
+        from tiss_tuwel_cli.cli import clear_tuwel_cache
+        clear_tuwel_cache()
         config.clear_token()
         rprint("[green]Auth token cleared.[/green]")
     else:
@@ -198,6 +198,9 @@ def _execute_cli_command(command: str, args: list):
     This avoids the CliRunner which captures output as plain text,
     losing Rich formatting.
     """
+    # TUWEL-backed commands accept --refresh to bypass cached responses
+    refresh = "--refresh" in args
+
     # Map commands to their handler functions
     if command == "login":
         from tiss_tuwel_cli.cli.auth import login
@@ -209,19 +212,19 @@ def _execute_cli_command(command: str, args: list):
 
     elif command == "dashboard":
         from tiss_tuwel_cli.cli.dashboard import dashboard
-        dashboard()
+        dashboard(refresh=refresh)
 
     elif command == "courses":
         from tiss_tuwel_cli.cli.courses import courses
-        courses()
+        courses(refresh=refresh)
 
     elif command == "assignments":
         from tiss_tuwel_cli.cli.courses import assignments
-        assignments()
+        assignments(refresh=refresh)
 
     elif command == "checkmarks":
         from tiss_tuwel_cli.cli.courses import checkmarks
-        checkmarks()
+        checkmarks(refresh=refresh)
 
     elif command == "grades":
         from tiss_tuwel_cli.cli.courses import grades
@@ -245,7 +248,7 @@ def _execute_cli_command(command: str, args: list):
 
     elif command == "todo":
         from tiss_tuwel_cli.cli.todo import todo
-        todo()
+        todo(refresh=refresh)
 
     elif command == "rc":
         from tiss_tuwel_cli.cli.rc import rc
@@ -253,7 +256,7 @@ def _execute_cli_command(command: str, args: list):
 
     elif command == "weekly":
         from tiss_tuwel_cli.cli.dashboard import weekly_overview
-        weekly_overview()
+        weekly_overview(refresh=refresh)
 
     elif command == "tiss-course":
         from tiss_tuwel_cli.cli.courses import tiss_course
@@ -266,7 +269,7 @@ def _execute_cli_command(command: str, args: list):
 
     elif command == "unified-view":
         from tiss_tuwel_cli.cli.features import unified_course_view
-        unified_course_view()
+        unified_course_view(refresh=refresh)
 
     elif command == "export-calendar":
         from tiss_tuwel_cli.cli.features import export_calendar
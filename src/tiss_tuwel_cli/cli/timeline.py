@@ -3,6 +3,7 @@ Unified Timeline command merging TUWEL events and TISS exams.
 """
 
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -104,7 +105,7 @@ def timeline(export: bool = False, output: Optional[str] = None):
             pass  # Skip if date parsing fails
 
     # 5. Sort by timestamp
-    timeline_events.sort(key=lambda x: x['timestamp'])
+    timeline_events.sort(key=itemgetter('timestamp'))
 
     # 6. Display or Export
     if export:
@@ -13,11 +13,16 @@ from tiss_tuwel_cli.utils import extract_course_number, format_course_name
 console = Console()
 
 
-def todo():
+def todo(refresh: bool = False):
     """
     Check for urgent tasks, specifically upcoming checkmark deadlines with no ticks.
+
+    Args:
+        refresh: Ignore cached TUWEL responses and fetch fresh data.
     """
     client = get_tuwel_client()
+    if refresh:
+        client.clear_cache()
 
     with console.status("[bold green]Checking for urgent tasks...[/bold green]"):
         # 1. Fetch courses
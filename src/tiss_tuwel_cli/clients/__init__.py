@@ -3,6 +3,6 @@ API clients for TISS and TUWEL.
 """
 
 from .tiss import TissClient
-from .tuwel import TuwelClient, TuwelAPIError
+from .tuwel import GradeRow, TuwelClient, TuwelAPIError
 
-__all__ = ["TissClient", "TuwelClient", "TuwelAPIError"]
+__all__ = ["TissClient", "TuwelClient", "TuwelAPIError", "GradeRow"]
@@ -7,11 +7,19 @@ to fetch course information, exam dates, and public events.
 API Documentation: https://tiss.tuwien.ac.at/api
 """
 
+import json
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import requests
 
+from tiss_tuwel_cli import cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
 
 class TissAPIError(Exception):
     """Custom exception for TISS API errors."""
@@ -37,6 +45,10 @@ class TissClient:
 
     BASE_URL = "https://tiss.tuwien.ac.at/api"
 
+    # Namespace of the conditional-GET response cache (ETag / Last-Modified),
+    # see tiss_tuwel_cli.cache. Entries never expire, they are revalidated.
+    CACHE_NAMESPACE = "tiss"
+
     def __init__(self, timeout: int = 10):
         """
         Initialize the TISS client.
@@ -45,6 +57,35 @@ class TissClient:
             timeout: Request timeout in seconds (default: 10).
         """
         self.timeout = timeout
+        # Keep-alive session so consecutive calls share one TCP/TLS connection
+        self.session = requests.Session()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> "TissClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Return the cache key for a request."""
+        return f"{endpoint}?{sorted((params or {}).items())}"
+
+    def _store_cached(self, cache_key: str, response: requests.Response) -> None:
+        """Persist a response together with its validators for later conditional GETs."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        cache.store(self.CACHE_NAMESPACE, cache_key, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": response.content.decode("utf-8", errors="replace"),
+        })
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -61,10 +102,21 @@ class TissClient:
             TissAPIError: On API errors or parsing failures.
         """
         url = f"{self.BASE_URL}{endpoint}"
+
+        # Revalidate a previously cached response instead of re-downloading it
+        cache_key = self._cache_key(endpoint, params)
+        cached = cache.load(self.CACHE_NAMESPACE, cache_key, float("inf"))
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
             # Try to get JSON first, but TISS often returns XML despite Request headers
             # Note: We don't force Accept: application/json anymore as it caused 500 errors
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
             # The TISS API returns 404 if no events/exams are found.
@@ -76,18 +128,24 @@ class TissClient:
         except requests.RequestException as e:
             raise TissAPIError(str(e))
 
+        if response.status_code == 304 and cached:
+            content = cached.get("body", "").encode()
+        else:
+            content = response.content
+            self._store_cached(cache_key, response)
+
         # Handle empty responses
-        if not response.content or not response.text.strip():
+        if not content or not content.strip():
             raise TissAPIError("Empty response from TISS API")
 
         # Try JSON parsing
         try:
-            return response.json()
+            return orjson.loads(content) if orjson else json.loads(content)
         except ValueError as json_e:
             # Fallback: Try XML parsing
             try:
                 import xml.etree.ElementTree as ET
-                root = ET.fromstring(response.content)
+                root = ET.fromstring(content)
 
                 # Namespaces found in the TISS response
                 ns = {
@@ -8,10 +8,20 @@ TUWEL provides access to courses, assignments, grades, calendar events,
 and other educational resources.
 """
 
+import shutil
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, NamedTuple, Optional, Callable, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from tiss_tuwel_cli import cache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 
 class TuwelAPIError(Exception):
@@ -19,6 +29,18 @@ class TuwelAPIError(Exception):
     pass
 
 
+# Stand-in for missing/null cells of a grade report row
+_EMPTY_CELL: Dict[str, Any] = {}
+
+
+class GradeRow(NamedTuple):
+    """A grade report row reduced to the cells that are displayed (raw HTML content)."""
+    name: str
+    grade: str
+    percentage: str
+    grade_range: str
+
+
 class TuwelClient:
     """
     Client for interacting with the TUWEL (Moodle) Web Service.
@@ -41,7 +63,25 @@ class TuwelClient:
 
     BASE_URL = "https://tuwel.tuwien.ac.at/webservice/rest/server.php"
 
-    def __init__(self, token: str, timeout: int = 15, token_refresh_callback: Optional[Callable[[], str]] = None):
+    # Size of the keep-alive connection pool shared by API calls and downloads.
+    POOL_SIZE = 16
+
+    # Seconds a web service response is reused. The cache is shared by all
+    # clients in the process (keyed by token), so e.g. consecutive commands
+    # in the shell or interactive mode don't refetch the same data.
+    CACHE_TTL = 300
+    _response_cache: Dict[tuple, Tuple[float, Any]] = {}
+
+    # Responses that are also kept on disk across CLI invocations (if the
+    # client has a cache namespace), with their time to live in seconds
+    DISK_CACHE_TTLS = {
+        "core_calendar_get_calendar_upcoming_view": 900,
+        "core_course_get_enrolled_courses_by_timeline_classification": 3600,
+        "mod_assign_get_assignments": 900,
+    }
+
+    def __init__(self, token: str, timeout: int = 15, token_refresh_callback: Optional[Callable[[], str]] = None,
+                 cache_namespace: Optional[str] = None):
         """
         Initialize the TUWEL client.
         
@@ -50,10 +90,48 @@ class TuwelClient:
             timeout: Request timeout in seconds (default: 15).
             token_refresh_callback: Optional function to call if token is invalid. 
                                     Should return a new valid token string or raise an exception.
+            cache_namespace: Optional per-user namespace under which the responses
+                             listed in DISK_CACHE_TTLS are persisted (see
+                             tiss_tuwel_cli.cache). Tokens are short-lived, so the
+                             disk cache is keyed by this instead of the token.
         """
         self.token = token
         self.timeout = timeout
         self.token_refresh_callback = token_refresh_callback
+        self.cache_namespace = cache_namespace
+
+        # Reuse TCP/TLS connections across calls (and across download threads)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def token(self) -> str:
+        """The authentication token used for API requests."""
+        return self._token
+
+    @token.setter
+    def token(self, value: str) -> None:
+        self._token = value
+        # Fixed part of every web service payload, rebuilt only when the token changes
+        self._base_payload = {"wstoken": value, "moodlewsrestformat": "json"}
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached web service responses, forcing fresh requests."""
+        self._response_cache.clear()
+        if self.cache_namespace:
+            cache.clear(self.cache_namespace)
+
+    def __enter__(self) -> "TuwelClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _call(self, wsfunction: str, params: Optional[Dict[str, Any]] = None, _retry: bool = True) -> Any:
         """
@@ -65,7 +143,8 @@ class TuwelClient:
             _retry: Internal flag to prevent infinite recursion during token refresh.
             
         Returns:
-            JSON response from the API.
+            JSON response from the API. Responses are cached for ``CACHE_TTL``
+            seconds and shared, so callers must not modify them.
             
         Raises:
             TuwelAPIError: On Moodle API exceptions.
@@ -76,29 +155,35 @@ class TuwelClient:
 
         # Moodle expects lists as indexed arrays. Using explicit indices `key[i]=value`
         # is safer than `key[]=value` as some plugins/parsers map the latter inconsistently.
-        scalar_params = {}
-        list_params = []
-        for key, value in params.items():
-            if isinstance(value, list):
-                for i, item in enumerate(value):
-                    list_params.append((f"{key}[{i}]", item))
-            else:
-                scalar_params[key] = value
-
-        payload = {
-            "wstoken": self.token,
-            "wsfunction": wsfunction,
-            "moodlewsrestformat": "json",
-        }
-        payload.update(scalar_params)
+        scalar_params = {key: value for key, value in params.items() if not isinstance(value, list)}
+        list_params = [
+            (f"{key}[{i}]", item)
+            for key, value in params.items() if isinstance(value, list)
+            for i, item in enumerate(value)
+        ]
+
+        cache_key = (self.token, wsfunction, tuple(scalar_params.items()), tuple(list_params))
+        cached = self._response_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
+        disk_ttl = self.DISK_CACHE_TTLS.get(wsfunction) if self.cache_namespace else None
+        if disk_ttl:
+            disk_key = repr(cache_key[1:])
+            data = cache.load(self.cache_namespace, disk_key, disk_ttl)
+            if data is not None:
+                self._response_cache[cache_key] = (time.monotonic(), data)
+                return data
+
+        payload = {**self._base_payload, "wsfunction": wsfunction, **scalar_params}
 
         # Combine the dict payload with the list of tuples for requests to handle
         final_payload = list(payload.items()) + list_params
 
         try:
-            response = requests.post(self.BASE_URL, data=final_payload, timeout=self.timeout)
+            response = self.session.post(self.BASE_URL, data=final_payload, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
 
             if isinstance(data, dict) and "exception" in data:
                 error_msg = data.get('message', '')
@@ -124,7 +209,12 @@ class TuwelClient:
 
                 raise TuwelAPIError(f"TUWEL Error: {error_msg}")
 
+            self._response_cache[cache_key] = (time.monotonic(), data)
+            if disk_ttl:
+                cache.store(self.cache_namespace, disk_key, data)
             return data
+        except ValueError as e:
+            raise TuwelAPIError(f"Invalid response from TUWEL: {str(e)}")
         except requests.RequestException as e:
             raise TuwelAPIError(f"Network Error: {str(e)}")
 
@@ -163,6 +253,10 @@ class TuwelClient:
     def get_enrolled_courses(self, classification: str = 'inprogress') -> List[Dict[str, Any]]:
         """
         Get courses the user is enrolled in.
+
+        Most commands (and get_assignments) ask for the same list several
+        times; repeats are served from the response cache (``CACHE_TTL``)
+        and, with a cache namespace, from disk (see ``DISK_CACHE_TTLS``).
         
         Args:
             classification: Filter courses by timeline status.
@@ -223,6 +317,40 @@ class TuwelClient:
         params = {"courseid": course_id, "userid": user_id}
         return self._call("gradereport_user_get_grades_table", params)
 
+    def get_grade_rows(self, course_id: int, user_id: int) -> Optional[List[GradeRow]]:
+        """
+        Fetch the grade report of a course as compact rows.
+
+        Only the item name, grade, percentage and range cells are kept; the
+        rest of the (large) report structure is dropped right after decoding.
+
+        Args:
+            course_id: The TUWEL course ID.
+            user_id: The TUWEL user ID.
+
+        Returns:
+            List of GradeRow tuples, or None if the course has no grade table.
+
+        Example:
+            >>> client = TuwelClient("your_token_here")
+            >>> for row in client.get_grade_rows(12345, 67890) or []:
+            ...     print(row.name, row.grade)
+        """
+        tables = self.get_user_grades_table(course_id, user_id).get('tables', [])
+        if not tables:
+            return None
+
+        rows = []
+        for item in tables[0].get('tabledata', []):
+            get = item.get
+            rows.append(GradeRow(
+                name=(get('itemname') or _EMPTY_CELL).get('content', ''),
+                grade=(get('grade') or _EMPTY_CELL).get('content', '-'),
+                percentage=(get('percentage') or _EMPTY_CELL).get('content', '-'),
+                grade_range=(get('range') or _EMPTY_CELL).get('content', '-'),
+            ))
+        return rows
+
     def get_checkmarks(self, course_ids: List[int]) -> Dict[str, Any]:
         """
         Fetch 'Kreuzerlübung' (mod_checkmark) exercise data.
@@ -247,13 +375,14 @@ class TuwelClient:
         # Always fetch all checkmarks to avoid API issues with array arguments
         response = self._call("mod_checkmark_get_checkmarks_by_courses", {"courseids": []})
 
-        # Filter client-side if specific courses were requested
+        # Filter client-side if specific courses were requested (into a copy,
+        # the full response is cached and shared)
         if course_ids:
             filtered = []
             for cm in response.get('checkmarks', []):
                 if cm.get('course') in course_ids:
                     filtered.append(cm)
-            response['checkmarks'] = filtered
+            response = {**response, 'checkmarks': filtered}
 
         return response
 
@@ -304,7 +433,12 @@ class TuwelClient:
         """
         return self._call("core_course_get_contents", {"courseid": course_id})
 
-    def download_file(self, file_url: str, output_path: Path) -> None:
+    def download_file(
+            self,
+            file_url: str,
+            output_path: Path,
+            progress: Optional[Callable[[int], None]] = None
+    ) -> None:
         """
         Download a file from TUWEL.
         
@@ -313,6 +447,8 @@ class TuwelClient:
         Args:
             file_url: The file URL from TUWEL (from course contents).
             output_path: Local path where the file should be saved.
+            progress: Optional callback invoked with the number of bytes
+                written after each chunk.
             
         Raises:
             requests.HTTPError: On download failure.
@@ -328,8 +464,14 @@ class TuwelClient:
         separator = "&" if "?" in file_url else "?"
         download_url = f"{file_url}{separator}token={self.token}"
 
-        with requests.get(download_url, stream=True) as r:
+        with self.session.get(download_url, stream=True, timeout=self.timeout) as r:
             r.raise_for_status()
+            # Let the copy loop run in C instead of iterating chunks in Python
+            r.raw.decode_content = True
             with open(output_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                if progress is None:
+                    shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+                else:
+                    for chunk in iter(lambda: r.raw.read(1024 * 1024), b''):
+                        f.write(chunk)
+                        progress(len(chunk))
@@ -5,14 +5,30 @@ This module handles persistent storage of user configuration including
 TUWEL authentication tokens and user IDs.
 """
 
+import hashlib
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+try:
+    import keyring
+except ImportError:  # optional, see the "keyring" extra
+    keyring = None
 
 # Default configuration directory and file paths
 CONFIG_DIR = Path.home() / ".tu_companion"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# Service name under which the TUWEL password is kept in the OS keyring
+KEYRING_SERVICE = "tiss-tuwel-cli"
+
 
 class ConfigManager:
     """
@@ -40,6 +56,8 @@ class ConfigManager:
         """
         self.config_dir = config_dir or CONFIG_DIR
         self.config_file = config_file or CONFIG_FILE
+        self._cache: Optional[Dict] = None
+        self._cache_stamp: Optional[tuple] = None
         self._ensure_config_exists()
 
     def _ensure_config_exists(self) -> None:
@@ -53,24 +71,84 @@ class ConfigManager:
         """
         Load configuration from the JSON file.
 
+        The parsed configuration is cached in memory and only re-read when
+        the file changes on disk (e.g. written by another ConfigManager
+        instance or edited externally).
+
         Returns:
             Dictionary containing the configuration, or empty dict on error.
         """
+        stamp = self._file_stamp()
+        if self._cache is not None and stamp == self._cache_stamp:
+            return self._cache
+
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return {}
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            self._cache = orjson.loads(data) if orjson else json.loads(data)
+        except (ValueError, FileNotFoundError):
+            self._cache = {}
+        self._cache_stamp = stamp
+        return self._cache
 
     def _save_config(self, config: Dict) -> None:
         """
         Save configuration to the JSON file.
+
+        The file is written to a private temporary sibling first and then
+        atomically moved into place, so an interrupted write never leaves a
+        truncated config behind and concurrent processes don't share a
+        temporary file.
         
         Args:
             config: Dictionary containing the configuration to save.
         """
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=4)
+        # orjson only supports two-space indentation, use it for both paths
+        # so the file looks the same with or without the "fast" extra
+        if orjson:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode()
+        # mkstemp creates the file with mode 0o600 - it holds the token and
+        # possibly the password
+        fd, tmp_name = tempfile.mkstemp(dir=self.config_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, self.config_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self._cache = config
+        self._cache_stamp = self._file_stamp()
+
+    def _file_stamp(self) -> Optional[tuple]:
+        """
+        Return a (inode, mtime_ns, size) stamp used to detect changes to the config file.
+
+        The inode catches atomic replaces that keep the size and land within
+        the same mtime tick on filesystems with coarse timestamps.
+        """
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def update(self, **values) -> None:
+        """
+        Store several configuration values with a single write.
+
+        Args:
+            **values: Configuration keys and their values
+                (e.g. ``tuwel_token=..., tuwel_userid=...``).
+
+        Example:
+            >>> config.update(tuwel_token="my_token", tuwel_userid=42)
+        """
+        config = self._load_config()
+        config.update(values)
+        self._save_config(config)
 
     def get_tuwel_token(self) -> Optional[str]:
         """
@@ -114,28 +192,137 @@ class ConfigManager:
         config["tuwel_userid"] = userid
         self._save_config(config)
 
+    def get_token_validation(self, token: str) -> Optional[float]:
+        """
+        Get when the given token was last validated against TUWEL.
+
+        Args:
+            token: The token to look up.
+
+        Returns:
+            Unix timestamp of the last successful validation, or None if the
+            token was never validated (or a different token was).
+        """
+        validation = self._load_config().get("token_validation") or {}
+        if validation.get("token_hash") != self._token_hash(token):
+            return None
+        return validation.get("validated_at")
+
+    def set_token_validation(self, token: str, userid: Optional[int], timestamp: float) -> None:
+        """
+        Record a successful validation of a token.
+
+        Only a short hash of the token is stored.
+
+        Args:
+            token: The validated token.
+            userid: The user ID reported by TUWEL.
+            timestamp: Unix timestamp of the validation.
+        """
+        config = self._load_config()
+        config["token_validation"] = self.token_validation_record(token, userid, timestamp)
+        self._save_config(config)
+
+    @classmethod
+    def token_validation_record(cls, token: str, userid: Optional[int], timestamp: float) -> Dict[str, Any]:
+        """
+        Build the stored record of a token validation.
+
+        Useful to save it together with other values in one ``update()``.
+
+        Args:
+            token: The validated token.
+            userid: The user ID reported by TUWEL.
+            timestamp: Unix timestamp of the validation.
+
+        Returns:
+            The record to store under the ``token_validation`` key.
+        """
+        return {
+            "token_hash": cls._token_hash(token),
+            "userid": userid,
+            "validated_at": timestamp,
+        }
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        """Return a short, stable hash of a token."""
+        return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
+    @property
+    def uses_keyring(self) -> bool:
+        """Whether passwords are stored in the OS keyring instead of the config file."""
+        if keyring is None:
+            return False
+        try:
+            from keyring.backends import fail
+            # Without a real backend (e.g. headless Linux) keyring falls back
+            # to one that rejects every write
+            return not isinstance(keyring.get_keyring(), fail.Keyring)
+        except Exception:
+            return False
+
     def get_login_credentials(self) -> tuple[Optional[str], Optional[str]]:
         """
-        Get TUWEL login credentials from the config file.
+        Get TUWEL login credentials.
+
+        The password is read from the config file if it was stored there,
+        otherwise from the OS keyring (if available).
 
         Returns:
             A tuple containing (username, password), or (None, None) if not set.
         """
         config = self._load_config()
-        return config.get("tuwel_user"), config.get("tuwel_pass")
-
-    def set_login_credentials(self, user: str, passw: str) -> None:
+        user = config.get("tuwel_user")
+        passw = config.get("tuwel_pass")
+        if user and passw is None and keyring:
+            try:
+                passw = keyring.get_password(KEYRING_SERVICE, user)
+            except Exception:
+                passw = None  # No usable keyring backend
+        return user, passw
+
+    def set_login_credentials(self, user: str, passw: str) -> bool:
         """
-        Save TUWEL login credentials to the config file.
+        Save TUWEL login credentials.
+
+        The password goes to the OS keyring when the optional ``keyring``
+        package is installed and has a working backend; otherwise it is
+        stored in the config file.
 
         Args:
             user: The TUWEL username.
             passw: The TUWEL password.
+
+        Returns:
+            True if the password was stored in the keyring, False if it was
+            stored in plain text in the config file.
         """
         config = self._load_config()
         config["tuwel_user"] = user
         config["tuwel_pass"] = passw
+        in_keyring = False
+        if keyring:
+            try:
+                keyring.set_password(KEYRING_SERVICE, user, passw)
+                del config["tuwel_pass"]
+                in_keyring = True
+            except Exception:
+                pass  # No usable keyring backend - keep it in the config file
         self._save_config(config)
+        return in_keyring
+
+    def get_storage_state_path(self) -> Path:
+        """
+        Get the path of the saved browser session (cookies, local storage).
+
+        Logins load this state so that an existing SSO session can hand out
+        a new token without entering credentials again.
+
+        Returns:
+            Path to the browser state file (it may not exist yet).
+        """
+        return self.config_dir / "browser_state.json"
 
     # ==================== SETTINGS MANAGEMENT ====================
 
@@ -192,14 +379,20 @@ class ConfigManager:
     def clear_credentials(self) -> None:
         """Remove saved login credentials from config."""
         config = self._load_config()
-        config.pop("tuwel_user", None)
+        user = config.pop("tuwel_user", None)
         config.pop("tuwel_pass", None)
         self._save_config(config)
+        if user and keyring:
+            try:
+                keyring.delete_password(KEYRING_SERVICE, user)
+            except Exception:
+                pass  # Nothing stored there
 
     def clear_token(self) -> None:
         """Remove saved TUWEL token from config."""
         config = self._load_config()
         config.pop("tuwel_token", None)
+        config.pop("token_validation", None)
         self._save_config(config)
 
     def reset_settings(self) -> None:
@@ -6,11 +6,27 @@ and other common operations used across the application.
 """
 
 import base64
+import functools
 import html
 import re
+import time
 import urllib.parse
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from rich.table import Table
+
+# Matches any HTML tag; `[^>]` keeps the scan linear (no backtracking)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# TISS course numbers inside TUWEL shortnames: "192.167" or "192167"
+_DOTTED_COURSE_NUM_RE = re.compile(r'(\d{3})\.(\d{3})')
+_PLAIN_COURSE_NUM_RE = re.compile(r'\b(\d{6})\b')
+
+# Parts of a course title that are noise for a VoWi search
+_LEADING_COURSE_NUM_RE = re.compile(r'^\d{3}\.\d{3}\s*')
+_TRAILING_TYPE_SEMESTER_RE = re.compile(r'\s*\([^)]+\)\s*\d{4}[WS]\s*$')
+_TRAILING_SEMESTER_RE = re.compile(r'\s*\d{4}[WS]\s*$')
 
 
 def timestamp_to_date(ts: Optional[int]) -> str:
@@ -31,7 +47,32 @@ def timestamp_to_date(ts: Optional[int]) -> str:
     """
     if not ts:
         return "N/A"
-    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M')
+    return _format_timestamp(int(ts))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(ts: int) -> str:
+    """Format a Unix timestamp as local 'YYYY-MM-DD HH:MM' (cached, deadlines repeat often)."""
+    lt = time.localtime(ts)
+    return "%04d-%02d-%02d %02d:%02d" % (lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min)
+
+
+def build_table(columns: Sequence[Tuple[str, Dict[str, Any]]], **table_kwargs) -> Table:
+    """
+    Create a Rich table from a column spec.
+    
+    Args:
+        columns: (header, add_column keyword arguments) pairs, usually a
+            module-level constant next to the command that renders it.
+        **table_kwargs: Passed on to Table (title, expand, box, ...).
+        
+    Returns:
+        An empty table with all columns added.
+    """
+    table = Table(**table_kwargs)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 
 def parse_mobile_token(token_string: str) -> Optional[str]:
@@ -58,20 +99,19 @@ def parse_mobile_token(token_string: str) -> Optional[str]:
         'token'
     """
     # Extract base64 part
-    base64_message = token_string
-    if "token=" in token_string:
-        base64_message = token_string.split("token=")[1]
+    base64_message = token_string.partition("token=")[2] or token_string
 
     # URL Decode (in case browser encoded special chars in base64)
-    base64_message = urllib.parse.unquote(base64_message)
+    if "%" in base64_message:
+        base64_message = urllib.parse.unquote(base64_message)
 
     try:
-        # Base64 Decode
-        message_bytes = base64.b64decode(base64_message)
+        # Base64 Decode (accepts both the standard and the URL-safe alphabet)
+        message_bytes = base64.b64decode(base64_message, altchars=b'-_')
         message = message_bytes.decode('ascii')
 
         # Extract middle part: PASSPORT:::TOKEN:::PRIVATE
-        parts = message.split(':::')
+        parts = message.split(':::', 2)
         if len(parts) >= 2:
             return parts[1]
     except Exception:
@@ -80,10 +120,14 @@ def parse_mobile_token(token_string: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=2048)
 def strip_html(html_string: str) -> str:
     """
     Remove HTML tags and decode HTML entities from a string.
     
+    Results are cached (bounded to 2048 entries) since grade reports
+    repeat the same cell markup across many rows.
+    
     Args:
         html_string: String potentially containing HTML markup.
         
@@ -100,7 +144,7 @@ def strip_html(html_string: str) -> str:
         return ""
 
     # Remove all HTML tags
-    text = re.sub(r'<[^>]+>', '', html_string)
+    text = _TAG_RE.sub('', html_string)
 
     # Decode HTML entities (e.g., &ndash; &nbsp; &amp;)
     text = html.unescape(text)
@@ -135,6 +179,7 @@ def parse_percentage(percent_str: str) -> Optional[float]:
         return None
 
 
+@functools.lru_cache(maxsize=256)
 def extract_course_number(shortname: str) -> Optional[str]:
     """
     Extract a TISS course number from a TUWEL course shortname.
@@ -147,6 +192,7 @@ def extract_course_number(shortname: str) -> Optional[str]:
         
     Returns:
         The course number in format "XXXXXX" (6 digits) or None if not found.
+        Results are cached, since the same shortnames recur on every render.
     
     Example:
         >>> extract_course_number("VU 192.167 - Maths")
@@ -158,12 +204,12 @@ def extract_course_number(shortname: str) -> Optional[str]:
         return None
 
     # Pattern 1: Match XXX.XXX format
-    match = re.search(r'(\d{3})\.(\d{3})', shortname)
+    match = _DOTTED_COURSE_NUM_RE.search(shortname)
     if match:
         return match.group(1) + match.group(2)
 
     # Pattern 2: Match XXXXXX format (6 consecutive digits)
-    match = re.search(r'\b(\d{6})\b', shortname)
+    match = _PLAIN_COURSE_NUM_RE.search(shortname)
     if match:
         return match.group(1)
 
@@ -235,6 +281,62 @@ def days_until(date_str: str) -> Optional[int]:
         return None
 
 
+def summarize_assignments(
+        assignments: Iterable[dict],
+        now: Optional[float] = None,
+        overdue_days: int = 30
+) -> Tuple[int, int]:
+    """
+    Count pending and recently overdue assignments in a single pass.
+    
+    Args:
+        assignments: Assignment dicts as returned by mod_assign_get_assignments.
+        now: Reference Unix timestamp, defaults to the current time.
+        overdue_days: How far back a missed deadline still counts as overdue.
+        
+    Returns:
+        Tuple of (pending, overdue) counts.
+    
+    Example:
+        >>> summarize_assignments([{'duedate': 200}, {'duedate': 50}], now=100)
+        (1, 1)
+    """
+    if now is None:
+        now = time.time()
+    cutoff = now - overdue_days * 86400
+
+    pending = overdue = 0
+    for assign in assignments:
+        due = assign.get('duedate', 0)
+        if due > now:
+            pending += 1
+        elif due > cutoff:
+            overdue += 1
+    return pending, overdue
+
+
+def checkmark_totals(checkmarks: Iterable[dict]) -> Tuple[int, int]:
+    """
+    Count ticked and available examples over a list of checkmark activities.
+    
+    Args:
+        checkmarks: Checkmark dicts as returned by mod_checkmark_get_checkmarks_by_courses.
+        
+    Returns:
+        Tuple of (checked, total) example counts.
+    
+    Example:
+        >>> checkmark_totals([{'examples': [{'checked': True}, {'checked': False}]}, {}])
+        (1, 2)
+    """
+    checked = total = 0
+    for cm in checkmarks:
+        examples = cm.get('examples') or ()
+        total += len(examples)
+        checked += len([ex for ex in examples if ex.get('checked')])
+    return checked, total
+
+
 def get_vowi_search_url(course_title: str) -> str:
     """
     Generate a VoWi (TU Wien course wiki) search URL for a course.
@@ -254,9 +356,9 @@ def get_vowi_search_url(course_title: str) -> str:
     """
     # Clean the title to get better search results
     # e.g., "104.633 Algebra... VU 2025W" -> "Algebra..."
-    search_query = re.sub(r'^\d{3}\.\d{3}\s*', '', course_title)
-    search_query = re.sub(r'\s*\([^)]+\)\s*\d{4}[WS]\s*$', '', search_query)
-    search_query = re.sub(r'\s*\d{4}[WS]\s*$', '', search_query)
+    search_query = _LEADING_COURSE_NUM_RE.sub('', course_title)
+    search_query = _TRAILING_TYPE_SEMESTER_RE.sub('', search_query)
+    search_query = _TRAILING_SEMESTER_RE.sub('', search_query)
     search_query = search_query.strip()
 
     base_url = "https://vowi.fsinf.at/index.php"
@@ -309,6 +411,7 @@ def get_tiss_course_url(course_number: str, semester: Optional[str] = None) -> s
         return f"https://tiss.tuwien.ac.at/course/courseDetails.xhtml?courseNr={course_number}"
 
 
+@functools.lru_cache(maxsize=256)
 def format_course_name(name: str, number: Optional[str] = None) -> str:
     """
     Format a course name and number consistently.
@@ -321,7 +424,7 @@ def format_course_name(name: str, number: Optional[str] = None) -> str:
         number: The course number (e.g. "192.167").
         
     Returns:
-        Formatted string (e.g. "Software Engineering (192.167)").
+        Formatted string (e.g. "Software Engineering (192.167)"). Results are cached.
     """
     if not name:
         name = "Unknown Course"